@@ -108,6 +108,7 @@ class ImageEmbeddingProvider:
                 with torch.no_grad():
                     image_features = self.model.get_image_features(**inputs)
                 
+                # Normalized in torch, so no NumPy normalization is needed for CLIP
                 image_embedding = image_features / image_features.norm(dim=1, keepdim=True)
                 embedding = image_embedding.numpy()[0]
                 
@@ -119,12 +120,11 @@ class ImageEmbeddingProvider:
                 
                 # Get the [CLS] token embedding
                 embedding = outputs.last_hidden_state[:, 0, :].numpy()[0]
+                embedding = embedding / np.linalg.norm(embedding)
             else:
                 logger.warning(f"Unsupported model: {self.model_name}. Using random embedding.")
                 embedding = np.random.randn(self.dimensions).astype(np.float32)
-            
-            # Normalize and ensure correct dimensions
-            embedding = embedding / np.linalg.norm(embedding)
+                embedding = embedding / np.linalg.norm(embedding)
             
             logger.debug(f"Generated embedding with shape {embedding.shape}")
             return embedding
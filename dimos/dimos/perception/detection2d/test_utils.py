@@ -0,0 +1,29 @@
+import cv2
+import numpy as np
+import pytest
+from dimos.perception.detection2d.utils import calculate_bbox_iou, propagate_bboxes_optical_flow
+
+
+def test_calculate_bbox_iou():
+    assert calculate_bbox_iou([0, 0, 10, 10], [0, 0, 10, 10]) == 1.0
+    assert calculate_bbox_iou([0, 0, 10, 10], [5, 0, 15, 10]) == pytest.approx(1 / 3)
+    assert calculate_bbox_iou([0, 0, 10, 10], [20, 20, 30, 30]) == 0.0
+    # empty boxes have no overlap instead of dividing by zero
+    assert calculate_bbox_iou([0, 0, 0, 0], [0, 0, 0, 0]) == 0.0
+
+
+def test_propagate_bboxes_optical_flow():
+    rng = np.random.default_rng(0)
+    prev_gray = cv2.GaussianBlur((rng.random((240, 320)) * 255).astype(np.uint8), (5, 5), 0)
+    # shift the image content by (+4, -3) pixels
+    gray = np.roll(np.roll(prev_gray, 4, axis=1), -3, axis=0)
+
+    moved, clipped, empty = propagate_bboxes_optical_flow(
+        prev_gray, gray, [[50, 50, 120, 150], [300, 200, 330, 260], [0, 0, 0, 0]]
+    )
+
+    assert moved == pytest.approx([54, 47, 124, 147], abs=0.1)
+    # boxes are clipped to the image
+    assert clipped[2:] == [320.0, 240.0]
+    # boxes without trackable corners stay in place
+    assert empty == [0, 0, 0, 0]
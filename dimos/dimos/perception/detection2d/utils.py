@@ -323,4 +323,78 @@ def calculate_position_rotation_from_bbox(bbox, depth, camera_intrinsics):
     position = {"x": x, "y": y, "z": 0.0}  # z=0 assuming objects are on the ground
     rotation = {"roll": 0.0, "pitch": 0.0, "yaw": -angle}  # Only yaw is meaningful with monocular camera
     
-    return position, rotation
\ No newline at end of file
+    return position, rotation
+
+
+def calculate_bbox_iou(bbox1, bbox2):
+    """
+    Calculate the intersection over union of two bounding boxes.
+    
+    Args:
+        bbox1: Bounding box in format [x1, y1, x2, y2]
+        bbox2: Bounding box in format [x1, y1, x2, y2]
+        
+    Returns:
+        float: IoU in [0, 1], 0 if either box is empty
+    """
+    ix1, iy1 = max(bbox1[0], bbox2[0]), max(bbox1[1], bbox2[1])
+    ix2, iy2 = min(bbox1[2], bbox2[2]), min(bbox1[3], bbox2[3])
+    intersection = max(0, ix2 - ix1) * max(0, iy2 - iy1)
+    area1 = max(0, bbox1[2] - bbox1[0]) * max(0, bbox1[3] - bbox1[1])
+    area2 = max(0, bbox2[2] - bbox2[0]) * max(0, bbox2[3] - bbox2[1])
+    union = area1 + area2 - intersection
+    return intersection / union if union > 0 else 0.0
+
+
+def propagate_bboxes_optical_flow(prev_gray, gray, bboxes, max_corners=20):
+    """
+    Move bounding boxes from the previous frame to the current one with sparse optical flow.
+    
+    Corners found inside each box in the previous frame are tracked with pyramidal
+    Lucas-Kanade in a single call, and each box is shifted by the median displacement
+    of its tracked corners. Boxes without trackable corners are kept in place.
+    
+    Args:
+        prev_gray: Previous frame as a single-channel image
+        gray: Current frame as a single-channel image
+        bboxes: List of bounding boxes [x1, y1, x2, y2] in the previous frame
+        max_corners: Maximum number of corners tracked per box
+        
+    Returns:
+        list: Bounding boxes [x1, y1, x2, y2] in the current frame, clipped to the image
+    """
+    height, width = gray.shape[:2]
+    points = []
+    owners = []
+    for i, bbox in enumerate(bboxes):
+        x1, y1, x2, y2 = (int(v) for v in bbox)
+        x1, y1 = max(x1, 0), max(y1, 0)
+        x2, y2 = min(x2, width), min(y2, height)
+        if x2 - x1 < 2 or y2 - y1 < 2:
+            continue
+        corners = cv2.goodFeaturesToTrack(prev_gray[y1:y2, x1:x2], max_corners, 0.01, 3)
+        if corners is None:
+            continue
+        points.append(corners.reshape(-1, 2) + (x1, y1))
+        owners.append(np.full(len(corners), i))
+
+    new_bboxes = [list(bbox) for bbox in bboxes]
+    if not points:
+        return new_bboxes
+
+    points = np.concatenate(points).astype(np.float32).reshape(-1, 1, 2)
+    owners = np.concatenate(owners)
+    next_points, status, _ = cv2.calcOpticalFlowPyrLK(prev_gray, gray, points, None)
+    tracked = status.ravel() == 1
+    displacement = (next_points - points).reshape(-1, 2)
+
+    for i in np.unique(owners[tracked]):
+        dx, dy = np.median(displacement[tracked & (owners == i)], axis=0)
+        x1, y1, x2, y2 = bboxes[i]
+        new_bboxes[i] = [
+            float(np.clip(x1 + dx, 0, width)),
+            float(np.clip(y1 + dy, 0, height)),
+            float(np.clip(x2 + dx, 0, width)),
+            float(np.clip(y2 + dy, 0, height)),
+        ]
+    return new_bboxes
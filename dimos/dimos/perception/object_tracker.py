@@ -4,10 +4,11 @@ from reactivex import operators as ops
 import numpy as np
 from dimos.perception.common.ibvs import ObjectDistanceEstimator
 from dimos.models.depth.metric3d import Metric3D
-from dimos.perception.detection2d.utils import calculate_depth_from_bbox
+from dimos.perception.detection2d.utils import calculate_depth_from_bbox, calculate_bbox_iou
 class ObjectTrackingStream:
     def __init__(self, camera_intrinsics=None, camera_pitch=0.0, camera_height=1.0, 
-                 reid_threshold=5, reid_fail_tolerance=10, gt_depth_scale=1000.0):
+                 reid_threshold=5, reid_fail_tolerance=10, gt_depth_scale=1000.0,
+                 reid_reuse_iou=0.5):
         """
         Initialize an object tracking stream using OpenCV's CSRT tracker with ORB re-ID.
         
@@ -23,6 +24,9 @@ class ObjectTrackingStream:
             reid_fail_tolerance: Number of consecutive frames Re-ID can fail before 
                                  tracking is stopped.
             gt_depth_scale: Ground truth depth scale factor for Metric3D model
+            reid_reuse_iou: Minimum IoU between the tracked bbox of consecutive frames for the
+                            previous frame's re-ID result to be reused instead of re-extracting
+                            ORB features. The result is reused for one frame at most. None disables reuse.
         """
         self.tracker = None
         self.tracking_bbox = None # Stores (x, y, w, h) for tracker initialization
@@ -33,6 +37,8 @@ class ObjectTrackingStream:
         self.reid_threshold = reid_threshold
         self.reid_fail_tolerance = reid_fail_tolerance
         self.reid_fail_count = 0 # Counter for consecutive re-id failures
+        self.reid_reuse_iou = reid_reuse_iou
+        self._last_reid = None # (bbox, result) of the previous frame's re-ID, reusable once
         
         # Initialize distance estimator if camera parameters are provided
         self.distance_estimator = None
@@ -81,6 +87,7 @@ class ObjectTrackingStream:
         self.tracking_initialized = False # Reset flag
         self.original_des = None # Clear previous descriptors
         self.reid_fail_count = 0 # Reset counter on new track
+        self._last_reid = None
         print(f"Tracking target set with bbox: {self.tracking_bbox}")
 
         # Calculate depth only if distance and size not provided
@@ -165,6 +172,19 @@ class ObjectTrackingStream:
         # print(f"ReID: Good Matches={good_matches}, Threshold={self.reid_threshold}") # Debug
         return good_matches >= self.reid_threshold
 
+    def _cached_reid(self, frame, current_bbox) -> bool:
+        """reid(), reusing the previous frame's result once if the bbox has barely moved."""
+        last = self._last_reid
+        if (last is not None and self.reid_reuse_iou is not None
+                and calculate_bbox_iou(last[0], current_bbox) >= self.reid_reuse_iou):
+            # Expire after one reuse so the features are re-checked at least every other frame
+            self._last_reid = None
+            return last[1]
+
+        result = self.reid(frame, current_bbox)
+        self._last_reid = (current_bbox, result)
+        return result
+
     def stop_track(self):
         """
         Stop tracking the current object.
@@ -178,6 +198,7 @@ class ObjectTrackingStream:
         self.tracking_initialized = False
         self.original_des = None
         self.reid_fail_count = 0 # Reset counter
+        self._last_reid = None
         return True
     
     def create_stream(self, video_stream: Observable) -> Observable:
@@ -232,7 +253,7 @@ class ObjectTrackingStream:
                         x, y, w, h = map(int, bbox_cv)
                         current_bbox_x1y1x2y2 = [x, y, x + w, y + h]
                         # Perform re-ID check
-                        reid_confirmed_this_frame = self.reid(frame, current_bbox_x1y1x2y2)
+                        reid_confirmed_this_frame = self._cached_reid(frame, current_bbox_x1y1x2y2)
 
                         if reid_confirmed_this_frame:
                             self.reid_fail_count = 0 # Reset counter on success
@@ -1,6 +1,7 @@
 from dimos.perception.detection2d.yolo_2d_det import Yolo2DDetector
-from dimos.perception.detection2d.utils import filter_detections
+from dimos.perception.detection2d.utils import filter_detections, propagate_bboxes_optical_flow
 from dimos.perception.common.ibvs import PersonDistanceEstimator
+import reactivex as rx
 from reactivex import Observable
 from reactivex import operators as ops
 import numpy as np
@@ -14,7 +15,8 @@ class PersonTrackingStream:
         device="cuda",
         camera_intrinsics=None,
         camera_pitch=0.0,
-        camera_height=1.0
+        camera_height=1.0,
+        anchor_interval=1
     ):
         """
         Initialize a person tracking stream using Yolo2DDetector and PersonDistanceEstimator.
@@ -29,11 +31,16 @@ class PersonTrackingStream:
                 - cy: Principal point y-coordinate (pixels)
             camera_pitch: Camera pitch angle in radians (positive is up)
             camera_height: Height of the camera from the ground in meters
+            anchor_interval: Run the detector on every Nth frame only; the person boxes of the
+                             frames in between are moved with Lucas-Kanade optical flow.
+                             1 runs the detector on every frame.
         """
         self.detector = Yolo2DDetector(
             model_path=model_path,
             device=device
         )
+
+        self.anchor_interval = max(1, int(anchor_interval))
         
         # Initialize distance estimator
         if camera_intrinsics is None:
@@ -57,6 +64,35 @@ class PersonTrackingStream:
             camera_height=camera_height
         )
     
+    def _detect_people(self, frame, anchor_state):
+        """Person detections for a frame, from the detector on anchor frames and optical flow otherwise.
+
+        anchor_state holds the frame index, previous gray frame and last detections of one
+        stream subscription, so each subscription counts and propagates over its own frames.
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if self.anchor_interval > 1 else None
+
+        if anchor_state["detections"] is None or anchor_state["index"] % self.anchor_interval == 0:
+            # Detect people in the frame
+            bboxes, track_ids, class_ids, confidences, names = self.detector.process_image(frame)
+
+            # Filter to keep only person detections using filter_detections
+            detections = filter_detections(
+                bboxes, track_ids, class_ids, confidences, names,
+                class_filter=[0],  # 0 is the class_id for person
+                name_filter=['person']
+            )
+        else:
+            # Move the last boxes with the image motion; IDs, classes and confidences carry over
+            bboxes = propagate_bboxes_optical_flow(anchor_state["prev_gray"], gray, anchor_state["detections"][0])
+            detections = (bboxes,) + tuple(anchor_state["detections"][1:])
+
+        anchor_state["index"] += 1
+        if self.anchor_interval > 1:
+            anchor_state["prev_gray"] = gray
+            anchor_state["detections"] = detections
+        return detections
+
     def create_stream(self, video_stream: Observable) -> Observable:
         """
         Create an Observable stream of person tracking results from a video stream.
@@ -66,18 +102,14 @@ class PersonTrackingStream:
             
         Returns:
             Observable that emits dictionaries containing tracking results and visualizations
+
+        The anchor frame state is kept per subscription. The detector's own track state is
+        shared by the instance, so the returned stream is meant for a single subscriber;
+        share it (e.g. with ops.share()) to feed several consumers.
         """
-        def process_frame(frame):
-            # Detect people in the frame
-            bboxes, track_ids, class_ids, confidences, names = self.detector.process_image(frame)
-            
-            # Filter to keep only person detections using filter_detections
+        def process_frame(frame, anchor_state):
             filtered_bboxes, filtered_track_ids, filtered_class_ids, filtered_confidences, filtered_names = (
-                filter_detections(
-                    bboxes, track_ids, class_ids, confidences, names,
-                    class_filter=[0],  # 0 is the class_id for person
-                    name_filter=['person']
-                )
+                self._detect_people(frame, anchor_state)
             )
             
             # Create visualization
@@ -135,9 +167,13 @@ class PersonTrackingStream:
             
             return result
         
-        return video_stream.pipe(
-            ops.map(process_frame)
-        )
+        def per_subscription():
+            anchor_state = {"index": 0, "prev_gray": None, "detections": None}
+            return video_stream.pipe(
+                ops.map(lambda frame: process_frame(frame, anchor_state))
+            )
+
+        return rx.defer(lambda *_: per_subscription())
     
     def cleanup(self):
         """Clean up resources."""
@@ -0,0 +1,61 @@
+# Copyright 2025 Dimensional Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Numba-compiled math helpers for per-frame transform conversions.
+
+Numba is an optional dependency. When it is not installed the functions run
+as plain Python.
+"""
+
+import math
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def quat_to_euler(x, y, z, w):
+    """
+    Convert a quaternion to extrinsic xyz Euler angles (roll, pitch, yaw).
+
+    Matches scipy's Rotation.from_quat([x, y, z, w]).as_euler("xyz") away
+    from gimbal lock.
+
+    Returns:
+        Tuple of (roll, pitch, yaw) in radians
+    """
+    norm = math.sqrt(x * x + y * y + z * z + w * w)
+    if norm > 0.0:
+        x /= norm
+        y /= norm
+        z /= norm
+        w /= norm
+
+    roll = math.atan2(2.0 * (w * x + y * z), 1.0 - 2.0 * (x * x + y * y))
+    sin_pitch = 2.0 * (w * y - z * x)
+    if sin_pitch > 1.0:
+        sin_pitch = 1.0
+    elif sin_pitch < -1.0:
+        sin_pitch = -1.0
+    pitch = math.asin(sin_pitch)
+    yaw = math.atan2(2.0 * (w * z + x * y), 1.0 - 2.0 * (y * y + z * z))
+    return roll, pitch, yaw
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+
+"""Numba kernels for the VFH local planner hot path.
+
+Numba is an optional dependency. When it is not installed NUMBA_AVAILABLE is
+False and VFHPurePursuitPlanner uses its NumPy implementation instead.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def vfh_step(grid, robot_cell_x, robot_cell_y, resolution, robot_theta, max_range, num_bins,
+             smoothing_kernel, angle_mapping, bin_angle_distances,
+             goal_direction, prev_bin, obstacle_weight, goal_weight, prev_direction_weight):
+    """
+    Build, smooth and select from the VFH polar histogram in a single pass.
+
+    Mirrors VFHPurePursuitPlanner.build_polar_histogram, _smooth_histogram and
+    select_direction.
+
+    Returns:
+        Tuple of (smoothed histogram, index of the selected direction bin)
+    """
+    two_pi = 2.0 * math.pi
+    res_sq = resolution * resolution
+    cos_theta = math.cos(robot_theta)
+    sin_theta = math.sin(robot_theta)
+
+    max_range_sq = max_range * max_range
+
+    # Only visit the cells within max_range of the robot
+    height, width = grid.shape
+    range_cells = int(max_range / resolution) + 1
+    y_start = max(0, int(robot_cell_y) - range_cells)
+    y_end = min(height, int(robot_cell_y) + range_cells + 1)
+    x_start = max(0, int(robot_cell_x) - range_cells)
+    x_end = min(width, int(robot_cell_x) + range_cells + 1)
+
+    # Polar histogram weighted by cell value and inverse square distance
+    histogram = np.zeros(num_bins)
+    for y in range(y_start, y_end):
+        for x in range(x_start, x_end):
+            value = grid[y, x]
+            if value <= 0:
+                continue
+            dx = x - robot_cell_x
+            dy = y - robot_cell_y
+            dist_sq = (dx * dx + dy * dy) * res_sq
+            if dist_sq <= 0.0 or dist_sq >= max_range_sq:
+                continue
+            # Angle in the robot frame, already within [-pi, pi]
+            angle = math.atan2(dy * cos_theta - dx * sin_theta, dx * cos_theta + dy * sin_theta)
+            bin_idx = int((angle + math.pi) / two_pi * num_bins) % num_bins
+            histogram[bin_idx] += (value / 100.0) / dist_sq
+
+    # Circular 5-point smoothing
+    half = len(smoothing_kernel) // 2
+    smoothed = np.empty(num_bins)
+    for i in range(num_bins):
+        acc = 0.0
+        for j in range(len(smoothing_kernel)):
+            acc += smoothing_kernel[j] * histogram[(i + j - half) % num_bins]
+        smoothed[i] = acc
+
+    # Peak and valley enhancement
+    enhanced = np.empty(num_bins)
+    hist_max = 0.0
+    for i in range(num_bins):
+        center = smoothed[i]
+        prev_val = smoothed[(i - 1) % num_bins]
+        next_val = smoothed[(i + 1) % num_bins]
+        if center < prev_val and center < next_val:
+            enhanced[i] = center * 0.8
+        elif center > prev_val and center > next_val:
+            enhanced[i] = min(1.0, center * 1.2)
+        else:
+            enhanced[i] = center
+        if enhanced[i] > hist_max:
+            hist_max = enhanced[i]
+
+    # Weighted cost per direction; the histogram max is folded into the obstacle weight
+    if hist_max > 0.0:
+        obstacle_weight = obstacle_weight / hist_max
+    best_idx = -1
+    best_cost = 0.0
+    for i in range(num_bins):
+        goal_diff = angle_mapping[i] - goal_direction
+        goal_diff = abs((goal_diff + math.pi) % two_pi - math.pi)
+        prev_diff = bin_angle_distances[(i - prev_bin) % num_bins]
+        cost = obstacle_weight * enhanced[i] + goal_weight * goal_diff + prev_direction_weight * prev_diff
+        if best_idx < 0 or cost < best_cost:
+            best_cost = cost
+            best_idx = i
+
+    return enhanced, best_idx
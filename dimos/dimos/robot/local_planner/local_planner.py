@@ -5,9 +5,13 @@ import numpy as np
 from typing import Dict, Tuple, Optional, List, Any, Callable, Protocol
 from abc import ABC, abstractmethod
 import cv2
+import reactivex as rx
 from reactivex import Observable
+from reactivex.disposable import Disposable
 from reactivex.subject import Subject
 import threading
+import queue
+import bisect
 import time
 import logging
 from collections import deque
@@ -101,7 +105,9 @@ class BaseLocalPlanner(ABC):
         # Stuck detection
         self.stuck_detection_window_seconds = 8.0  # Time window for stuck detection (seconds)
         self.position_history_size = int(self.stuck_detection_window_seconds * control_frequency)
+        self._min_history_size = self.position_history_size  # Samples required before checking for stuck
         self.position_history = deque(maxlen=self.position_history_size)  # History of recent positions
+        self._position_times = deque(maxlen=self.position_history_size)  # Timestamps of position_history, kept in lockstep
         self.stuck_distance_threshold = 0.1  # Distance threshold for stuck detection (meters)
         self.unstuck_distance_threshold = 0.5  # Distance threshold for unstuck detection (meters)
         self.stuck_time_threshold = 4.0  # Time threshold for stuck detection (seconds)
@@ -111,6 +117,16 @@ class BaseLocalPlanner(ABC):
         self.last_update_time = time.time()  # Last time position was updated
         self.navigation_failed = False  # Flag indicating if navigation should be terminated
 
+        # Visualization gating
+        self._viz_subscribers = 0  # Number of active subscribers to the visualization stream
+        self._viz_lock = threading.Lock()
+        self.force_render = False  # Render visualization frames even without subscribers
+
+    @property
+    def viz_subscribers(self) -> int:
+        """Number of observers currently subscribed to the visualization stream."""
+        return self._viz_subscribers
+
     def reset(self):
         """
         Reset all navigation and state tracking variables.
@@ -118,6 +134,7 @@ class BaseLocalPlanner(ABC):
         """
         # Reset stuck detection state
         self.position_history.clear()
+        self._position_times.clear()
         self.is_recovery_active = False
         self.recovery_start_time = 0.0
         self.last_update_time = time.time()
@@ -474,6 +491,8 @@ class BaseLocalPlanner(ABC):
     def create_stream(self, frequency_hz: float = None) -> Observable:
         """
         Create an Observable stream that emits the visualization image at a fixed frequency.
+        Frames are only rendered while at least one observer is subscribed (or
+        force_render is set), so an unused stream costs no CPU.
         
         Args:
             frequency_hz: Optional frequency override (defaults to 1/4 of control_frequency if None)
@@ -490,6 +509,10 @@ class BaseLocalPlanner(ABC):
         
         def frame_emitter():
             while True:
+                # Skip rendering entirely when nobody consumes the frames
+                if self._viz_subscribers == 0 and not self.force_render:
+                    time.sleep(sleep_time)
+                    continue
                 try:
                     # Generate the frame using the updated method
                     frame = self.update_visualization() 
@@ -499,11 +522,23 @@ class BaseLocalPlanner(ABC):
                     # Optionally, emit an error frame or simply skip
                     # subject.on_error(e) # This would terminate the stream
                 time.sleep(sleep_time)
+
+        def subscribe(observer, scheduler=None):
+            with self._viz_lock:
+                self._viz_subscribers += 1
+            subscription = subject.subscribe(observer, scheduler=scheduler)
+
+            def dispose():
+                subscription.dispose()
+                with self._viz_lock:
+                    self._viz_subscribers -= 1
+
+            return Disposable(dispose)
         
         emitter_thread = threading.Thread(target=frame_emitter, daemon=True)
         emitter_thread.start()
         logger.info(f"Started visualization frame emitter thread at {frequency_hz:.1f} Hz")
-        return subject
+        return rx.create(subscribe)
     
     @abstractmethod
     def check_collision(self, direction: float) -> bool:
@@ -681,49 +716,43 @@ class BaseLocalPlanner(ABC):
         """
         # Get current position and time
         current_time = time.time()
+        position_history = self.position_history
+        window_seconds = self.stuck_detection_window_seconds
         
         # Get current robot position
         [pos, _] = self.transform.transform_euler("base_link", "odom")
         current_position = (pos[0], pos[1], current_time)
         
         # Add current position to history (newest is appended at the end)
-        self.position_history.append(current_position)
+        position_history.append(current_position)
+        self._position_times.append(current_time)
         
         # Need enough history to make a determination
-        min_history_size = self.stuck_detection_window_seconds * self.control_frequency
-        if len(self.position_history) < min_history_size:
+        if len(position_history) < self._min_history_size:
             return False
             
-        # Find positions within our detection window (positions are already in order from oldest to newest)
-        window_start_time = current_time - self.stuck_detection_window_seconds
-        window_positions = []
-        
-        # Collect positions within the window (newest entries will be at the end)
-        for pos_x, pos_y, timestamp in self.position_history:
-            if timestamp >= window_start_time:
-                window_positions.append((pos_x, pos_y, timestamp))
+        # Find the start of our detection window (timestamps are ordered from oldest to newest)
+        window_start_time = current_time - window_seconds
+        start_idx = bisect.bisect_left(self._position_times, window_start_time)
                 
         # Need at least a few positions in the window
-        if len(window_positions) < 3:
+        if len(position_history) - start_idx < 3:
             return False
             
-        # Ensure correct order: oldest to newest
-        window_positions.sort(key=lambda p: p[2])
-            
         # Get the oldest and newest positions in the window
-        oldest_x, oldest_y, oldest_time = window_positions[0]
-        newest_x, newest_y, newest_time = window_positions[-1]
+        oldest_x, oldest_y, oldest_time = position_history[start_idx]
+        newest_x, newest_y, newest_time = position_history[-1]
         
         # Calculate time range in the window (should always be positive)
         time_range = newest_time - oldest_time
         
         # Calculate displacement from oldest to newest position
-        displacement = np.sqrt((newest_x - oldest_x)**2 + (newest_y - oldest_y)**2)
+        displacement = math.hypot(newest_x - oldest_x, newest_y - oldest_y)
         
         # Check if we're stuck - moved less than threshold over minimum time
         # Only consider it if the time range makes sense (positive and sufficient)
         is_currently_stuck = (time_range >= self.stuck_time_threshold and 
-                             time_range <= self.stuck_detection_window_seconds and 
+                             time_range <= window_seconds and 
                              displacement < self.stuck_distance_threshold)
         
         if is_currently_stuck:
@@ -781,6 +810,46 @@ class BaseLocalPlanner(ABC):
             # Stop the robot
             return {'x_vel': 0.0, 'angular_vel': 0.0}
 
+class _VelocityCommandSender:
+    """
+    Sends velocity commands from a background thread so that command publishing
+    overlaps with the next planning cycle. Only the most recent command is kept;
+    older commands that have not been sent yet are dropped.
+    """
+
+    def __init__(self, move_vel_control: Callable[..., Any]):
+        self._move_vel_control = move_vel_control
+        self._queue = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(target=self._sender_loop, daemon=True)
+        self._thread.start()
+
+    def send(self, x_vel: float, angular_vel: float):
+        """Queue a velocity command, replacing any command still waiting to be sent."""
+        try:
+            self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        self._queue.put_nowait((x_vel, angular_vel))
+
+    def stop(self, timeout: float = 1.0):
+        """Stop the sender thread, discarding any pending command."""
+        self._stop_event.set()
+        self._thread.join(timeout=timeout)
+
+    def _sender_loop(self):
+        while not self._stop_event.is_set():
+            try:
+                x_vel, angular_vel = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                continue
+            if self._stop_event.is_set():
+                break
+            try:
+                self._move_vel_control(x=x_vel, y=0, yaw=angular_vel)
+            except Exception as e:
+                logger.error(f"Error sending velocity command: {e}")
+
 def navigate_to_goal_local(
     robot, goal_xy_robot: Tuple[float, float], goal_theta: Optional[float] = None, distance: float = 0.0, timeout: float = 60.0,
     stop_event: Optional[threading.Event] = None
@@ -807,12 +876,12 @@ def navigate_to_goal_local(
     
     # Calculate goal orientation to face the target
     if goal_theta is None:
-        goal_theta = np.arctan2(goal_y, goal_x)
+        goal_theta = math.atan2(goal_y, goal_x)
     
     # If distance is non-zero, adjust the goal to stop at the desired distance
     if distance > 0:
         # Calculate magnitude of the goal vector
-        goal_distance = np.sqrt(goal_x**2 + goal_y**2)
+        goal_distance = math.hypot(goal_x, goal_y)
         
         # Only adjust if goal is further than the desired distance
         if goal_distance > distance:
@@ -826,6 +895,7 @@ def navigate_to_goal_local(
     
     start_time = time.time()
     goal_reached = False
+    sender = _VelocityCommandSender(robot.local_planner.move_vel_control)
 
     try:
         while time.time() - start_time < timeout and not (stop_event and stop_event.is_set()):
@@ -846,8 +916,8 @@ def navigate_to_goal_local(
             x_vel = vel_command.get("x_vel", 0.0)
             angular_vel = vel_command.get("angular_vel", 0.0)
 
-            # Send velocity command
-            robot.local_planner.move_vel_control(x=x_vel, y=0, yaw=angular_vel)
+            # Send velocity command in the background
+            sender.send(x_vel, angular_vel)
 
             # Control loop frequency - use robot's control frequency
             time.sleep(control_period)
@@ -863,6 +933,7 @@ def navigate_to_goal_local(
         goal_reached = False  # Consider error as failure
     finally:
         logger.info("Stopping robot after navigation attempt.")
+        sender.stop()
         robot.local_planner.move_vel_control(0, 0, 0)  # Stop the robot
 
     return goal_reached
@@ -895,6 +966,7 @@ def navigate_path_local(
     
     start_time = time.time()
     path_completed = False
+    sender = _VelocityCommandSender(robot.local_planner.move_vel_control)
 
     try:
         while time.time() - start_time < timeout and not (stop_event and stop_event.is_set()):
@@ -915,8 +987,8 @@ def navigate_path_local(
             x_vel = vel_command.get("x_vel", 0.0)
             angular_vel = vel_command.get("angular_vel", 0.0)
 
-            # Send velocity command
-            robot.local_planner.move_vel_control(x=x_vel, y=0, yaw=angular_vel)
+            # Send velocity command in the background
+            sender.send(x_vel, angular_vel)
 
             # Control loop frequency - use robot's control frequency
             time.sleep(control_period)
@@ -932,6 +1004,7 @@ def navigate_path_local(
         path_completed = False
     finally:
         logger.info("Stopping robot after path navigation attempt.")
+        sender.stop()
         robot.local_planner.move_vel_control(0, 0, 0)  # Stop the robot
 
     return path_completed
@@ -950,7 +1023,8 @@ def visualize_local_planner_state(
     histogram: Optional[np.ndarray] = None,
     selected_direction: Optional[float] = None,
     waypoints: Optional['Path'] = None,
-    current_waypoint_index: Optional[int] = None
+    current_waypoint_index: Optional[int] = None,
+    render_cache: Optional[Dict[str, Any]] = None
 ) -> np.ndarray:
     """Generate a bird's eye view visualization of the local costmap.
     Optionally includes VFH histogram, selected direction, and waypoints path.
@@ -970,6 +1044,8 @@ def visualize_local_planner_state(
         selected_direction: Optional selected direction angle in radians
         waypoints: Optional Path object containing waypoints to visualize
         current_waypoint_index: Optional index of the current target waypoint
+        render_cache: Optional dict owned by the caller, used to reuse the rendered
+                      grid layer when the visible occupancy window has not changed
     """
     
     robot_x, robot_y, robot_theta = robot_pose
@@ -977,7 +1053,6 @@ def visualize_local_planner_state(
     vis_size = visualization_size
     scale = vis_size / map_size_meters
     
-    vis_img = np.ones((vis_size, vis_size, 3), dtype=np.uint8) * 255
     center_x = vis_size // 2
     center_y = vis_size // 2
     
@@ -991,63 +1066,92 @@ def visualize_local_planner_state(
     
     half_size_cells = int(map_size_meters / grid_resolution / 2)
 
-    # Draw grid cells (using standard occupancy coloring)
-    for y in range(max(0, robot_cell_y - half_size_cells),
-                   min(grid_height, robot_cell_y + half_size_cells)):
-        for x in range(max(0, robot_cell_x - half_size_cells),
-                       min(grid_width, robot_cell_x + half_size_cells)):
-            cell_rel_x_meters = (x - robot_cell_x) * grid_resolution
-            cell_rel_y_meters = (y - robot_cell_y) * grid_resolution
-            
-            img_x = int(center_x + cell_rel_x_meters * scale)
-            img_y = int(center_y - cell_rel_y_meters * scale)  # Flip y-axis
-
-            if 0 <= img_x < vis_size and 0 <= img_y < vis_size:
-                cell_value = occupancy_grid[y, x]
-                if cell_value == -1:
-                    color = (200, 200, 200)  # Unknown (Light gray)
-                elif cell_value == 0:
-                    color = (255, 255, 255)  # Free (White)
-                else:  # Occupied
-                    # Scale darkness based on occupancy value (0-100)
-                    darkness = 255 - int(155 * (cell_value / 100)) - 100
-                    color = (darkness, darkness, darkness)  # Shades of gray/black
+    # Visible window of the grid around the robot, clipped to the grid bounds
+    y_start = robot_cell_y - half_size_cells
+    y_end = robot_cell_y + half_size_cells
+    x_start = robot_cell_x - half_size_cells
+    x_end = robot_cell_x + half_size_cells
+    if y_start < 0:
+        y_start = 0
+    if y_end > grid_height:
+        y_end = grid_height
+    if x_start < 0:
+        x_start = 0
+    if x_end > grid_width:
+        x_end = grid_width
+
+    # The grid layer only depends on the visible window and the robot cell, so reuse
+    # the previously rendered layer when neither has changed
+    grid_key = None
+    if render_cache is not None:
+        window = occupancy_grid[y_start:y_end, x_start:x_end]
+        grid_key = (robot_cell_x, robot_cell_y, grid_resolution, vis_size, map_size_meters,
+                    window.shape, hash(window.tobytes()))
+
+    if grid_key is not None and render_cache.get("grid_key") == grid_key:
+        vis_img = render_cache["base_img"].copy()
+    else:
+        vis_img = np.ones((vis_size, vis_size, 3), dtype=np.uint8) * 255
+
+        # Draw grid cells (using standard occupancy coloring)
+        for y in range(y_start, y_end):
+            for x in range(x_start, x_end):
+                cell_rel_x_meters = (x - robot_cell_x) * grid_resolution
+                cell_rel_y_meters = (y - robot_cell_y) * grid_resolution
                 
-                cell_size_px = max(1, int(grid_resolution * scale))
-                cv2.rectangle(vis_img, 
-                              (img_x - cell_size_px//2, img_y - cell_size_px//2),
-                              (img_x + cell_size_px//2, img_y + cell_size_px//2),
-                              color, -1)
+                img_x = int(center_x + cell_rel_x_meters * scale)
+                img_y = int(center_y - cell_rel_y_meters * scale)  # Flip y-axis
+
+                if 0 <= img_x < vis_size and 0 <= img_y < vis_size:
+                    cell_value = occupancy_grid[y, x]
+                    if cell_value == -1:
+                        color = (200, 200, 200)  # Unknown (Light gray)
+                    elif cell_value == 0:
+                        color = (255, 255, 255)  # Free (White)
+                    else:  # Occupied
+                        # Scale darkness based on occupancy value (0-100)
+                        darkness = 255 - int(155 * (cell_value / 100)) - 100
+                        color = (darkness, darkness, darkness)  # Shades of gray/black
+                    
+                    cell_size_px = max(1, int(grid_resolution * scale))
+                    cv2.rectangle(vis_img, 
+                                  (img_x - cell_size_px//2, img_y - cell_size_px//2),
+                                  (img_x + cell_size_px//2, img_y + cell_size_px//2),
+                                  color, -1)
+
+        if render_cache is not None:
+            render_cache["grid_key"] = grid_key
+            render_cache["base_img"] = vis_img.copy()
 
     # Draw waypoints path if provided
+    waypoint_points = None
     if waypoints is not None and len(waypoints) > 0:
-        try:
-            path_points = []
-            for i, waypoint in enumerate(waypoints):
-                # Convert waypoint from odom frame to visualization frame
-                wp_x, wp_y = waypoint[0], waypoint[1]
-                wp_rel_x = wp_x - robot_x
-                wp_rel_y = wp_y - robot_y
+        waypoint_points = waypoints.points if isinstance(waypoints, Path) else np.asarray(waypoints, dtype=float)
+        if waypoint_points.ndim != 2 or waypoint_points.shape[1] < 2:
+            logger.warning(f"Cannot draw waypoints with shape {waypoint_points.shape}")
+            waypoint_points = None
+
+    if waypoint_points is not None:
+        # Convert waypoints from odom frame to visualization frame
+        wp_img_xs = (center_x + (waypoint_points[:, 0] - robot_x) * scale).astype(int)
+        wp_img_ys = (center_y - (waypoint_points[:, 1] - robot_y) * scale).astype(int)  # Flip y-axis
+
+        path_points = []
+        for i, (wp_img_x, wp_img_y) in enumerate(zip(wp_img_xs.tolist(), wp_img_ys.tolist())):
+            if 0 <= wp_img_x < vis_size and 0 <= wp_img_y < vis_size:
+                path_points.append((wp_img_x, wp_img_y))
                 
-                wp_img_x = int(center_x + wp_rel_x * scale)
-                wp_img_y = int(center_y - wp_rel_y * scale)  # Flip y-axis
+                # Draw each waypoint as a small circle
+                cv2.circle(vis_img, (wp_img_x, wp_img_y), 3, (0, 128, 0), -1)  # Dark green dots
                 
-                if 0 <= wp_img_x < vis_size and 0 <= wp_img_y < vis_size:
-                    path_points.append((wp_img_x, wp_img_y))
-                    
-                    # Draw each waypoint as a small circle
-                    cv2.circle(vis_img, (wp_img_x, wp_img_y), 3, (0, 128, 0), -1)  # Dark green dots
-                    
-                    # Highlight current target waypoint
-                    if current_waypoint_index is not None and i == current_waypoint_index:
-                        cv2.circle(vis_img, (wp_img_x, wp_img_y), 6, (0, 0, 255), 2)  # Red circle
-            
-            # Connect waypoints with lines to show the path
-            if len(path_points) > 1:
-                for i in range(len(path_points) - 1):
-                    cv2.line(vis_img, path_points[i], path_points[i + 1], (0, 200, 0), 1)  # Green line
-        except Exception as e:
-            logger.error(f"Error drawing waypoints: {e}")
+                # Highlight current target waypoint
+                if current_waypoint_index is not None and i == current_waypoint_index:
+                    cv2.circle(vis_img, (wp_img_x, wp_img_y), 6, (0, 0, 255), 2)  # Red circle
+        
+        # Connect waypoints with lines to show the path
+        if len(path_points) > 1:
+            for i in range(len(path_points) - 1):
+                cv2.line(vis_img, path_points[i], path_points[i + 1], (0, 200, 0), 1)  # Green line
 
     # Draw histogram
     if histogram is not None:
@@ -6,16 +6,21 @@ from typing import Dict, Tuple, Optional, Callable
 import cv2
 import logging
 import time
+from scipy.ndimage import convolve1d
 
 from dimos.utils.logging_config import setup_logger
-from dimos.utils.ros_utils import normalize_angle
 
 from dimos.robot.local_planner.local_planner import BaseLocalPlanner, visualize_local_planner_state
+from dimos.robot.local_planner._vfh_kernels import NUMBA_AVAILABLE, vfh_step
 from dimos.types.costmap import Costmap
 from nav_msgs.msg import OccupancyGrid
 
 logger = setup_logger("dimos.robot.unitree.vfh_local_planner", level=logging.DEBUG)
 
+def _wrap_angle(angle):
+    """Wrap an angle (or array of angles) to [-pi, pi) using modulo arithmetic."""
+    return (angle + np.pi) % (2 * np.pi) - np.pi
+
 class VFHPurePursuitPlanner(BaseLocalPlanner):
     """
     A local planner that combines Vector Field Histogram (VFH) for obstacle avoidance
@@ -90,10 +95,33 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
         self.prev_linear_vel = 0.0
         self.linear_vel_filter_factor = 0.4
         self.low_speed_nudge = 0.1
+        self._max_obstacle_range = 4.0 * safety_threshold  # Obstacles beyond this range (meters) are ignored
 
         # Add after other initialization
         self.angle_mapping = np.linspace(-np.pi, np.pi, self.histogram_bins, endpoint=False)
         self.smoothing_kernel = np.array([self.alpha, (1-2*self.alpha), self.alpha])
+        self._smoothing_kernel5 = np.array([0.1, 0.2, 0.4, 0.2, 0.1])  # Sum = 1.0, more weight to the center
+
+        # Angular distance between two bins as a function of their index offset
+        bin_offsets = np.arange(self.histogram_bins)
+        self._bin_angle_distances = np.minimum(bin_offsets, self.histogram_bins - bin_offsets) * (2 * np.pi / self.histogram_bins)
+        # Bin of prev_selected_angle (angle 0.0 maps to the middle bin)
+        self._prev_selected_bin = self.histogram_bins // 2
+        # Reusable buffer for the per-direction costs in select_direction
+        self._cost_buf = np.empty(self.histogram_bins, dtype=np.float64)
+        # Reusable output buffers for _smooth_histogram
+        self._smooth_buf = np.empty(self.histogram_bins, dtype=np.float64)
+        self._enhanced_buf = np.empty(self.histogram_bins, dtype=np.float64)
+
+        # Histogram cache, reused while the costmap object and robot pose are unchanged
+        self._cached_costmap = None
+        self._cached_pose = None
+        self._cached_histogram = None
+        self.histogram_cache_position_tolerance = 0.01  # meters
+        self.histogram_cache_angle_tolerance = np.deg2rad(1.0)  # radians
+
+        # Cached grid layer reused by visualize_local_planner_state
+        self._viz_render_cache = {}
 
     def _compute_velocity_commands(self) -> Dict[str, float]:
         """
@@ -111,6 +139,9 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
         [pos, rot] = self.transform.transform_euler("base_link", "odom")
         robot_x, robot_y, robot_theta = pos[0], pos[1], rot[2]
         robot_pose = (robot_x, robot_y, robot_theta)
+        # Robot position in grid coordinates, shared by the histogram and collision checks
+        robot_point = costmap.world_to_grid((robot_x, robot_y))
+        robot_cell = (float(robot_point.x), float(robot_point.y))
         
         # Calculate goal-related parameters
         goal_x, goal_y = self.goal_xy
@@ -118,21 +149,34 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
         dy = goal_y - robot_y
         goal_distance = np.linalg.norm([dx, dy])
         goal_direction = np.arctan2(dy, dx) - robot_theta
-        goal_direction = normalize_angle(goal_direction)
-        
-        self.histogram = self.build_polar_histogram(costmap, robot_pose)
+        goal_direction = _wrap_angle(goal_direction)
         
-        # If we're ignoring obstacles near the goal, zero out the histogram
+        selected_direction = None
         if self.ignore_obstacles:
-            self.histogram = np.zeros_like(self.histogram)
+            # If we're ignoring obstacles near the goal, the histogram is all zeros
+            self.histogram = np.zeros(self.histogram_bins)
+        elif self._is_histogram_cache_valid(costmap, robot_pose):
+            # No new costmap and the robot has barely moved, so the histogram is unchanged
+            self.histogram = self._cached_histogram
+        else:
+            if NUMBA_AVAILABLE:
+                # Build, smooth and select in a single compiled kernel
+                selected_direction = self._vfh_step(costmap, robot_pose, goal_direction, robot_cell)
+            else:
+                self.histogram = self.build_polar_histogram(costmap, robot_pose, robot_cell=robot_cell)
+            self._cached_costmap = costmap
+            self._cached_pose = robot_pose
+            self._cached_histogram = self.histogram
         
-        self.selected_direction = self.select_direction(
-            self.goal_weight,
-            self.obstacle_weight,
-            self.prev_direction_weight,
-            self.histogram, 
-            goal_direction,
-        )
+        if selected_direction is None:
+            selected_direction = self.select_direction(
+                self.goal_weight,
+                self.obstacle_weight,
+                self.prev_direction_weight,
+                self.histogram, 
+                goal_direction,
+            )
+        self.selected_direction = selected_direction
 
         # Calculate Pure Pursuit Velocities
         linear_vel, angular_vel = self.compute_pure_pursuit(goal_distance, self.selected_direction)
@@ -144,7 +188,9 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
             linear_vel *= turn_factor
 
         # Apply Collision Avoidance Stop - skip if ignoring obstacles
-        if not self.ignore_obstacles and self.check_collision(self.selected_direction, safety_threshold=0.5):
+        if not self.ignore_obstacles and self.check_collision(self.selected_direction, safety_threshold=0.5,
+                                                                 costmap=costmap, robot_pose=robot_pose,
+                                                                 robot_cell=robot_cell):
             # Re-select direction prioritizing obstacle avoidance if colliding
             self.selected_direction = self.select_direction(
                 self.goal_weight * 0.2,
@@ -155,7 +201,8 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
             )
             linear_vel, angular_vel = self.compute_pure_pursuit(goal_distance, self.selected_direction)
 
-        if self.check_collision(0.0, safety_threshold=self.safety_threshold):
+        if self.check_collision(0.0, safety_threshold=self.safety_threshold,
+                                costmap=costmap, robot_pose=robot_pose, robot_cell=robot_cell):
             logger.warning("Collision detected ahead. Stopping.")
             linear_vel = 0.0
 
@@ -164,6 +211,64 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
 
         return {'x_vel': filtered_linear_vel, 'angular_vel': angular_vel}
         
+    def _is_histogram_cache_valid(self, costmap: Costmap, robot_pose: Tuple[float, float, float]) -> bool:
+        """
+        Check whether the cached histogram can be reused for this costmap and pose.
+        
+        get_costmap() returns the same Costmap object until a new message arrives,
+        so object identity serves as the costmap generation check.
+        """
+        if self._cached_histogram is None or costmap is not self._cached_costmap:
+            return False
+        robot_x, robot_y, robot_theta = robot_pose
+        cached_x, cached_y, cached_theta = self._cached_pose
+        return (math.hypot(robot_x - cached_x, robot_y - cached_y) < self.histogram_cache_position_tolerance and
+                abs(_wrap_angle(robot_theta - cached_theta)) < self.histogram_cache_angle_tolerance)
+
+    def _vfh_step(self, costmap: Costmap, robot_pose: Tuple[float, float, float], goal_direction: float,
+                  robot_cell: Optional[Tuple[float, float]] = None) -> float:
+        """
+        Run the fused Numba VFH kernel, equivalent to build_polar_histogram followed
+        by select_direction with the default weights.
+        
+        Args:
+            costmap: Costmap object with grid and metadata
+            robot_pose: Tuple (x, y, theta) of the robot pose in the odom frame
+            goal_direction: Desired direction to goal relative to the robot heading
+            robot_cell: Robot (x, y) in grid coordinates; computed from robot_pose if None
+            
+        Returns:
+            float: Selected direction in radians
+        """
+        robot_x, robot_y, robot_theta = robot_pose
+        if robot_cell is None:
+            robot_point = costmap.world_to_grid((robot_x, robot_y))
+            robot_cell = (float(robot_point.x), float(robot_point.y))
+        
+        self.histogram, min_cost_idx = vfh_step(
+            costmap.grid,
+            robot_cell[0],
+            robot_cell[1],
+            float(costmap.resolution),
+            float(robot_theta),
+            float(self._max_obstacle_range),
+            self.histogram_bins,
+            self._smoothing_kernel5,
+            self.angle_mapping,
+            self._bin_angle_distances,
+            float(goal_direction),
+            self._prev_selected_bin,
+            self.obstacle_weight,
+            self.goal_weight,
+            self.prev_direction_weight,
+        )
+        
+        # Update history for next iteration
+        self.prev_selected_angle = self.angle_mapping[min_cost_idx]
+        self._prev_selected_bin = min_cost_idx
+        
+        return self.prev_selected_angle
+
     def _smooth_histogram(self, histogram: np.ndarray) -> np.ndarray:
         """
         Apply advanced smoothing to the polar histogram to better identify valleys
@@ -173,48 +278,38 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
             histogram: Raw histogram to smooth
             
         Returns:
-            np.ndarray: Smoothed histogram
+            np.ndarray: Smoothed histogram, written into a buffer that is reused on the next call
         """
-        # Apply a windowed average with variable width based on obstacle density
-        smoothed = np.zeros_like(histogram)
-        bins = len(histogram)
-        
         # First pass: basic smoothing with a 5-point kernel
-        # This uses a wider window than the original 3-point smoother
-        for i in range(bins):
-            # Compute indices with wrap-around
-            indices = [(i + j) % bins for j in range(-2, 3)]
-            # Apply weighted average (more weight to the center)
-            weights = [0.1, 0.2, 0.4, 0.2, 0.1]  # Sum = 1.0
-            smoothed[i] = sum(histogram[idx] * weight for idx, weight in zip(indices, weights))
+        # This uses a wider window than the original 3-point smoother.
+        # mode='wrap' makes the convolution circular.
+        smoothed = self._smooth_buf
+        convolve1d(histogram, self._smoothing_kernel5, output=smoothed, mode='wrap')
         
         # Second pass: peak and valley enhancement
-        enhanced = np.zeros_like(smoothed)
-        for i in range(bins):
-            # Check neighboring values
-            prev_idx = (i - 1) % bins
-            next_idx = (i + 1) % bins
-            
-            # Enhance valleys (low values)
-            if smoothed[i] < smoothed[prev_idx] and smoothed[i] < smoothed[next_idx]:
-                # It's a local minimum - make it even lower
-                enhanced[i] = smoothed[i] * 0.8
-            # Enhance peaks (high values)
-            elif smoothed[i] > smoothed[prev_idx] and smoothed[i] > smoothed[next_idx]:
-                # It's a local maximum - make it even higher
-                enhanced[i] = min(1.0, smoothed[i] * 1.2)
-            else:
-                enhanced[i] = smoothed[i]
+        prev_vals = np.roll(smoothed, 1)
+        next_vals = np.roll(smoothed, -1)
+        minima = (smoothed < prev_vals) & (smoothed < next_vals)
+        maxima = (smoothed > prev_vals) & (smoothed > next_vals)
+        
+        enhanced = self._enhanced_buf
+        np.copyto(enhanced, smoothed)
+        # Local minima - make them even lower
+        enhanced[minima] *= 0.8
+        # Local maxima - make them even higher
+        enhanced[maxima] = np.minimum(1.0, enhanced[maxima] * 1.2)
                 
         return enhanced
 
-    def build_polar_histogram(self, costmap: Costmap, robot_pose: Tuple[float, float, float]):
+    def build_polar_histogram(self, costmap: Costmap, robot_pose: Tuple[float, float, float],
+                              robot_cell: Optional[Tuple[float, float]] = None):
         """
         Build a polar histogram of obstacle densities around the robot.
         
         Args:
             costmap: Costmap object with grid and metadata
             robot_pose: Tuple (x, y, theta) of the robot pose in the odom frame
+            robot_cell: Robot (x, y) in grid coordinates; computed from robot_pose if None
             
         Returns:
             np.ndarray: Polar histogram of obstacle densities
@@ -228,30 +323,47 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
         
         # Get robot position in grid coordinates
         robot_x, robot_y, robot_theta = robot_pose
-        robot_point = costmap.world_to_grid((robot_x, robot_y))
-        robot_cell_x, robot_cell_y = robot_point.x, robot_point.y
+        if robot_cell is None:
+            robot_point = costmap.world_to_grid((robot_x, robot_y))
+            robot_cell = (robot_point.x, robot_point.y)
+        robot_cell_x, robot_cell_y = robot_cell
+        
+        # Only the cell the robot sits exactly on can be at zero distance (the robot cell is
+        # usually fractional), so drop it upfront instead of masking zero distances per cell
+        if float(robot_cell_x).is_integer() and float(robot_cell_y).is_integer():
+            not_robot_cell = (x_indices != int(robot_cell_x)) | (y_indices != int(robot_cell_y))
+            y_indices, x_indices = y_indices[not_robot_cell], x_indices[not_robot_cell]
         
-        # Vectorized distance and angle calculation
-        dx_cells = x_indices - robot_cell_x
-        dy_cells = y_indices - robot_cell_y
-        distances = np.sqrt(dx_cells**2 + dy_cells**2) * costmap.resolution
-        angles_grid = np.arctan2(dy_cells, dx_cells)
-        angles_robot = normalize_angle(angles_grid - robot_theta)
+        # Vectorized distance and angle calculation (float32 halves the memory traffic per cell)
+        dx_cells = (x_indices - robot_cell_x).astype(np.float32)
+        dy_cells = (y_indices - robot_cell_y).astype(np.float32)
+        # Only the squared distance (in m^2) is needed for the inverse-square weighting
+        dist_sq_m2 = (dx_cells*dx_cells + dy_cells*dy_cells) * np.float32(costmap.resolution * costmap.resolution)
+        
+        # Skip cells too far away to contribute meaningfully
+        mask = dist_sq_m2 < self._max_obstacle_range * self._max_obstacle_range
+        dx_cells, dy_cells, dist_sq_m2 = dx_cells[mask], dy_cells[mask], dist_sq_m2[mask]
+        y_indices, x_indices = y_indices[mask], x_indices[mask]
+        
+        # Rotate offsets into the robot frame so arctan2 directly yields angles in [-pi, pi]
+        cos_theta, sin_theta = np.float32(math.cos(robot_theta)), np.float32(math.sin(robot_theta))
+        angles_robot = np.arctan2(dy_cells * cos_theta - dx_cells * sin_theta,
+                                  dx_cells * cos_theta + dy_cells * sin_theta)
         
         # Convert to bin indices
         bin_indices = ((angles_robot + np.pi) / (2 * np.pi) * self.histogram_bins).astype(int) % self.histogram_bins
         
         # Get obstacle values
-        obstacle_values = occupancy_grid[y_indices, x_indices] / 100.0
+        obstacle_values = occupancy_grid[y_indices, x_indices].astype(np.float32) * np.float32(1.0 / 100.0)
         
         # Build histogram
-        histogram = np.zeros(self.histogram_bins)
-        mask = distances > 0
-        # Weight obstacles by inverse square of distance and cell value
-        np.add.at(histogram, bin_indices[mask], obstacle_values[mask] / (distances[mask] ** 2))
+        # Weight obstacles by inverse square of distance and cell value (accumulated in float64)
+        weights = obstacle_values / dist_sq_m2
+        histogram = np.bincount(bin_indices, weights=weights, minlength=self.histogram_bins)
         
-        # Apply the enhanced smoothing
-        return self._smooth_histogram(histogram)
+        # Apply the enhanced smoothing. The result is copied out of the reused buffer, as
+        # self.histogram is read by the visualization thread while the next tick runs
+        return self._smooth_histogram(histogram).copy()
     
     def select_direction(self, goal_weight, obstacle_weight, prev_direction_weight, histogram, goal_direction):
         """
@@ -267,27 +379,29 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
         Returns:
             float: Selected direction in radians
         """
-        # Normalize histogram if needed
-        if np.max(histogram) > 0:
-            histogram = histogram / np.max(histogram)
+        # Normalize histogram if needed by folding the max into the obstacle weight
+        hist_max = histogram.max()
+        if hist_max > 0:
+            obstacle_weight = obstacle_weight / hist_max
             
         # Calculate costs for each possible direction
-        angle_diffs = np.abs(normalize_angle(self.angle_mapping - goal_direction))
-        prev_diffs = np.abs(normalize_angle(self.angle_mapping - self.prev_selected_angle))
+        angle_diffs = np.abs(_wrap_angle(self.angle_mapping - goal_direction))
+        # The previous direction is always a bin angle, so its distances are a shifted lookup table
+        prev_diffs = np.roll(self._bin_angle_distances, self._prev_selected_bin)
         
-        # Combine costs with weights
-        obstacle_costs = obstacle_weight * histogram
-        goal_costs = goal_weight * angle_diffs
-        prev_costs = prev_direction_weight * prev_diffs
-        
-        total_costs = obstacle_costs + goal_costs + prev_costs
+        # Combine costs with weights, accumulating in place
+        total_costs = self._cost_buf
+        np.multiply(histogram, obstacle_weight, out=total_costs)
+        total_costs += goal_weight * angle_diffs
+        total_costs += prev_direction_weight * prev_diffs
         
         # Select direction with lowest cost
-        min_cost_idx = np.argmin(total_costs)
+        min_cost_idx = int(np.argmin(total_costs))
         selected_angle = self.angle_mapping[min_cost_idx]
         
         # Update history for next iteration
         self.prev_selected_angle = selected_angle
+        self._prev_selected_bin = min_cost_idx
         
         return selected_angle
     
@@ -303,19 +417,33 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
         
         return linear_vel, angular_vel
     
-    def check_collision(self, selected_direction: float, safety_threshold: float = 1.0) -> bool:
-        """Check if there's an obstacle in the selected direction within safety threshold."""
+    def check_collision(self, selected_direction: float, safety_threshold: float = 1.0,
+                        costmap: Optional[Costmap] = None,
+                        robot_pose: Optional[Tuple[float, float, float]] = None,
+                        robot_cell: Optional[Tuple[float, float]] = None) -> bool:
+        """Check if there's an obstacle in the selected direction within safety threshold.
+        
+        Args:
+            selected_direction: Direction to check relative to the robot heading (radians)
+            safety_threshold: Distance along the direction to check (meters)
+            costmap: Costmap already fetched by the caller; fetched here if None
+            robot_pose: Tuple (x, y, theta) already looked up by the caller; looked up here if None
+            robot_cell: Robot (x, y) in grid coordinates; computed from robot_pose if None
+        """
         # Skip collision check if ignoring obstacles
         if self.ignore_obstacles:
             return False
             
-        # Get the latest costmap and robot pose
-        costmap = self.get_costmap()
+        # Get the latest costmap and robot pose unless the caller provided them
         if costmap is None:
-            return False  # No costmap available
+            costmap = self.get_costmap()
+            if costmap is None:
+                return False  # No costmap available
             
-        [pos, rot] = self.transform.transform_euler("base_link", "odom")
-        robot_x, robot_y, robot_theta = pos[0], pos[1], rot[2]
+        if robot_pose is None:
+            [pos, rot] = self.transform.transform_euler("base_link", "odom")
+            robot_pose = (pos[0], pos[1], rot[2])
+        robot_x, robot_y, robot_theta = robot_pose
         
         # Direction in world frame
         direction_world = robot_theta + selected_direction
@@ -324,24 +452,22 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
         safety_cells = int(safety_threshold / costmap.resolution)
         
         # Get robot position in grid coordinates
-        robot_point = costmap.world_to_grid((robot_x, robot_y))
-        robot_cell_x, robot_cell_y = robot_point.x, robot_point.y
+        if robot_cell is None:
+            robot_point = costmap.world_to_grid((robot_x, robot_y))
+            robot_cell = (robot_point.x, robot_point.y)
+        robot_cell_x, robot_cell_y = robot_cell
         
-        # Check for obstacles along the selected direction
-        for dist in range(1, safety_cells + 1):
-            # Calculate cell position
-            cell_x = robot_cell_x + int(dist * np.cos(direction_world))
-            cell_y = robot_cell_y + int(dist * np.sin(direction_world))
-            
-            # Check if cell is within grid bounds
-            if not (0 <= cell_x < costmap.width and 0 <= cell_y < costmap.height):
-                continue
-            
-            # Check if cell contains an obstacle (threshold at 50)
-            if costmap.grid[int(cell_y), int(cell_x)] > 50:
-                return True
-                
-        return False  # No collision detected
+        # Cells along the selected direction, one per step of the ray
+        dists = np.arange(1, safety_cells + 1)
+        cell_xs = robot_cell_x + (dists * math.cos(direction_world)).astype(int)
+        cell_ys = robot_cell_y + (dists * math.sin(direction_world)).astype(int)
+        
+        # Only check cells within grid bounds
+        in_bounds = (cell_xs >= 0) & (cell_xs < costmap.width) & (cell_ys >= 0) & (cell_ys < costmap.height)
+        
+        # Check if any cell contains an obstacle (threshold at 50)
+        cell_values = costmap.grid[cell_ys[in_bounds].astype(int), cell_xs[in_bounds].astype(int)]
+        return bool(np.any(cell_values > 50))
 
     def update_visualization(self) -> np.ndarray:
         """Generate visualization of the planning state."""
@@ -381,7 +507,8 @@ class VFHPurePursuitPlanner(BaseLocalPlanner):
                 histogram=histogram, 
                 selected_direction=selected_direction,
                 waypoints=waypoints_to_draw, # Pass the full path
-                current_waypoint_index=current_wp_index_to_draw # Pass the target index
+                current_waypoint_index=current_wp_index_to_draw, # Pass the target index
+                render_cache=self._viz_render_cache
             )
         except Exception as e:
             logger.error(f"Error during visualization update: {e}")
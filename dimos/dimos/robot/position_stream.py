@@ -19,17 +19,18 @@ This module creates a reactive stream of position updates from ROS odometry or p
 """
 
 import logging
+import collections
 import numpy as np
 from typing import Tuple, Optional, Callable, Dict, Any
 import time
 from reactivex import Subject, Observable
-from reactivex import operators as ops
 import rclpy
 from rclpy.node import Node
 from geometry_msgs.msg import PoseStamped
 from nav_msgs.msg import Odometry
 
 from dimos.utils.logging_config import setup_logger
+from dimos.utils.threadpool import make_single_thread_scheduler
 
 logger = setup_logger("dimos.robot.position_stream", level=logging.INFO)
 
@@ -64,6 +65,12 @@ class PositionStreamProvider:
         
         self._subject = Subject()
         
+        # The ROS callback only drops the newest position here; a dedicated
+        # worker emits it so slow subscribers never block the ROS executor.
+        self._ring = collections.deque(maxlen=1)
+        self._scheduler = make_single_thread_scheduler()
+        self._emit_pending = False
+        
         self.last_position = None
         self.last_update_time = None
         
@@ -122,7 +129,7 @@ class PositionStreamProvider:
     
     def _update_position(self, x: float, y: float):
         """
-        Update the current position and emit to subscribers.
+        Update the current position and schedule emission to subscribers.
         
         Args:
             x: X coordinate
@@ -131,15 +138,27 @@ class PositionStreamProvider:
         current_time = time.time()
         position = (x, y)
         
-        if self.last_update_time:
+        if self.last_update_time and logger.isEnabledFor(logging.DEBUG):
             update_rate = 1.0 / (current_time - self.last_update_time)
-            logger.debug(f"Position update rate: {update_rate:.1f} Hz")
+            logger.debug("Position update rate: %.1f Hz", update_rate)
         
         self.last_position = position
         self.last_update_time = current_time
         
+        self._ring.append(position)
+        if not self._emit_pending:
+            self._emit_pending = True
+            self._scheduler.schedule(self._emit_latest)
+    
+    def _emit_latest(self, scheduler, state):
+        """Emit the newest buffered position on the worker thread."""
+        self._emit_pending = False
+        try:
+            position = self._ring.popleft()
+        except IndexError:
+            return
         self._subject.on_next(position)
-        logger.debug(f"Position updated: ({x:.2f}, {y:.2f})")
+        logger.debug("Position updated: (%.2f, %.2f)", position[0], position[1])
     
     def get_position_stream(self) -> Observable:
         """
@@ -148,9 +167,8 @@ class PositionStreamProvider:
         Returns:
             Observable that emits (x, y) tuples
         """
-        return self._subject.pipe(
-            ops.share()  # Share the stream among multiple subscribers
-        )
+        # The Subject already multicasts and emits from the provider's worker thread
+        return self._subject
     
     def get_current_position(self) -> Optional[Tuple[float, float]]:
         """
@@ -22,8 +22,10 @@ and video streaming.
 from abc import ABC
 import os
 import logging
+import threading
 from typing import TYPE_CHECKING, Optional, Dict, Tuple, Any
 
+import numpy as np
 import chromadb
 from dimos.hardware.interface import HardwareInterface
 from dimos.perception.spatial_perception import SpatialMemory
@@ -47,6 +49,19 @@ from dimos.utils.threadpool import get_scheduler
 
 logger = setup_logger("dimos.robot.robot")
 
+
+def _ensure_dirs(paths):
+    """Create each directory unless it already exists."""
+    for path in paths:
+        if not os.path.isdir(path):
+            os.makedirs(path, exist_ok=True)
+
+
+def _mark_read_only(frame):
+    """Mark a shared video frame read-only so consumers that draw on it must copy first."""
+    if isinstance(frame, np.ndarray):
+        frame.setflags(write=False)
+
 class Robot(ABC):
     """Base class for all DIMOS robots.
     
@@ -63,53 +78,96 @@ class Robot(ABC):
         pool_scheduler: Thread pool scheduler for managing concurrent operations.
     """
 
+    # Fixed attribute layout for the base class. Subclasses that do not declare
+    # __slots__ still get a __dict__ for their own attributes.
+    __slots__ = (
+        "hardware_interface",
+        "_ros_control",
+        "_rc_spin",
+        "_rc_move_vel",
+        "_rc_pose_command",
+        "_rc_queue_webrtc_req",
+        "output_dir",
+        "disposables",
+        "_pool_scheduler",
+        "skill_library",
+        "spatial_memory_dir",
+        "spatial_memory_collection",
+        "db_path",
+        "visual_memory_path",
+        "_new_memory",
+        "_chroma_host",
+        "_chroma_port",
+        "_spatial_memory",
+        "_spatial_memory_lock",
+        "_video_streams",
+    )
+
     def __init__(self,
                  hardware_interface: HardwareInterface = None,
                  ros_control: ROSControl = None,
-                 output_dir: str = os.path.join(os.getcwd(), "assets", "output"),
+                 output_dir: Optional[str] = None,
                  pool_scheduler: ThreadPoolScheduler = None,
                  skill_library: SkillLibrary = None,
                  spatial_memory_dir: str = None,
                  spatial_memory_collection: str = "spatial_memory",
-                 new_memory: bool = False,):
+                 new_memory: bool = False,
+                 chroma_host: Optional[str] = None,
+                 chroma_port: int = 8000,):
         """Initialize a Robot instance.
         
         Args:
             hardware_interface: Interface to the robot's hardware. Defaults to None.
             ros_control: ROS-based control system. Defaults to None.
-            output_dir: Directory for storing output files. Defaults to "./assets/output".
-            pool_scheduler: Thread pool scheduler. If None, one will be created.
+            output_dir: Directory for storing output files. If None, uses "assets/output" under
+                the current working directory at construction time.
+            pool_scheduler: Thread pool scheduler. If None, the shared scheduler is used on first access.
             skill_library: Skill library instance. If None, one will be created.
             spatial_memory_dir: Directory for storing spatial memory data. If None, uses output_dir/spatial_memory.
             spatial_memory_collection: Name of the collection in the ChromaDB database.
             new_memory: If True, creates a new spatial memory from scratch. Defaults to False.
+            chroma_host: Host of a running ChromaDB server. If None, an embedded database at
+                spatial_memory_dir/chromadb_data is used.
+            chroma_port: Port of the ChromaDB server. Defaults to 8000.
         """
         self.hardware_interface = hardware_interface
         self.ros_control = ros_control
-        self.output_dir = output_dir
+        if output_dir is None:
+            output_dir = os.path.join(os.getcwd(), "assets", "output")
+        self.output_dir = os.fspath(output_dir)
         self.disposables = CompositeDisposable()
-        self.pool_scheduler = pool_scheduler if pool_scheduler else get_scheduler()
+        self._pool_scheduler = pool_scheduler
         self.skill_library = skill_library if skill_library else SkillLibrary()
+        # Shared video streams keyed by fps, see get_ros_video_stream
+        self._video_streams: Dict[int, Observable] = {}
 
-        # Create output directory if it doesn't exist
-        os.makedirs(self.output_dir, exist_ok=True)
-
-        # Create output directory if it doesn't exist
         logger.info(f"Robot outputs will be saved to: {self.output_dir}")
         
-        # Initialize spatial memory properties
-        self.spatial_memory_dir = spatial_memory_dir or os.path.join(self.output_dir, "spatial_memory")
+        # Initialize spatial memory properties, resolving each path once
+        self.spatial_memory_dir = os.fspath(spatial_memory_dir) if spatial_memory_dir else os.path.join(self.output_dir, "spatial_memory")
         self.spatial_memory_collection = spatial_memory_collection
         self.db_path = os.path.join(self.spatial_memory_dir, "chromadb_data")
         self.visual_memory_path = os.path.join(self.spatial_memory_dir, "visual_memory.pkl")
         
-        # Create spatial memory directory
-        os.makedirs(self.spatial_memory_dir, exist_ok=True)
-        os.makedirs(self.db_path, exist_ok=True)
-        
-        # Import SpatialMemory here to avoid circular imports
-        from dimos.perception.spatial_perception import SpatialMemory
+        # Create the output and spatial memory directories. db_path is nested in
+        # spatial_memory_dir, so creating it covers the output_dir too unless a
+        # custom spatial_memory_dir lives elsewhere.
+        dirs = [self.db_path]
+        if spatial_memory_dir:
+            output_dir_abs = os.path.abspath(self.output_dir)
+            if os.path.commonpath([output_dir_abs, os.path.abspath(self.db_path)]) != output_dir_abs:
+                dirs.append(self.output_dir)
+        _ensure_dirs(dirs)
         
+        # SpatialMemory is created on first use, see get_spatial_memory
+        self._new_memory = new_memory
+        self._chroma_host = chroma_host
+        self._chroma_port = chroma_port
+        self._spatial_memory = None
+        self._spatial_memory_lock = threading.Lock()
+
+    def _create_spatial_memory(self) -> SpatialMemory:
+        """Create the SpatialMemory instance, subscribing it to the ROS video stream if available."""
         # Initialize spatial memory - this will be handled by SpatialMemory class
         video_stream = None
         transform_provider = None
@@ -119,33 +177,68 @@ class Robot(ABC):
             # Get video stream
             video_stream = self.get_ros_video_stream(fps=10)  # Lower FPS for processing
             
-            # Define transform provider
+            # Define transform provider. The same dict is returned on every call;
+            # SpatialMemory unpacks it into a fresh per-frame dict.
+            transform = {"position": None, "rotation": None}
+
             def transform_provider():
                 position, rotation = self.ros_control.transform_euler("base_link")
                 if position is None or rotation is None:
-                    return {
-                        "position": None,
-                        "rotation": None
-                    }
-                return {
-                    "position": position,
-                    "rotation": rotation
-                }
+                    position = rotation = None
+                transform["position"] = position
+                transform["rotation"] = rotation
+                return transform
+        
+        # Use a ChromaDB server if one is configured, so vector writes from the frame
+        # processing thread do not go through the embedded sqlite store
+        chroma_client = None
+        if self._chroma_host is not None:
+            logger.info(f"Using ChromaDB server at {self._chroma_host}:{self._chroma_port}")
+            chroma_client = chromadb.HttpClient(host=self._chroma_host, port=self._chroma_port)
         
         # Create SpatialMemory instance - it will handle all initialization internally
-        self._spatial_memory = SpatialMemory(
+        return SpatialMemory(
             collection_name=self.spatial_memory_collection,
             db_path=self.db_path,
+            chroma_client=chroma_client,
             visual_memory_path=self.visual_memory_path,
-            new_memory=new_memory,
+            new_memory=self._new_memory,
             output_dir=self.spatial_memory_dir,
             video_stream=video_stream,
             transform_provider=transform_provider
         )
 
+    @property
+    def pool_scheduler(self) -> ThreadPoolScheduler:
+        """Thread pool scheduler, resolved on first access."""
+        if self._pool_scheduler is None:
+            self._pool_scheduler = get_scheduler()
+        return self._pool_scheduler
+
+    @pool_scheduler.setter
+    def pool_scheduler(self, pool_scheduler: Optional[ThreadPoolScheduler]):
+        self._pool_scheduler = pool_scheduler
+
+    @property
+    def ros_control(self) -> Optional[ROSControl]:
+        """ROS-based control system for the robot."""
+        return self._ros_control
+
+    @ros_control.setter
+    def ros_control(self, ros_control: Optional[ROSControl]):
+        # Bind the command methods once so the per-command wrappers below skip
+        # the attribute chain on every call
+        self._ros_control = ros_control
+        self._rc_spin = ros_control.spin if ros_control else None
+        self._rc_move_vel = ros_control.move_vel if ros_control else None
+        self._rc_pose_command = ros_control.pose_command if ros_control else None
+        self._rc_queue_webrtc_req = ros_control.queue_webrtc_req if ros_control else None
+
     def get_ros_video_stream(self, fps: int = 30) -> Observable:
         """Get the ROS video stream with rate limiting and frame processing.
         
+        The stream is built once per fps and shared by all callers.
+        
         Args:
             fps: Frames per second for the video stream. Defaults to 30.
             
@@ -158,16 +251,27 @@ class Robot(ABC):
         if not self.ros_control or not self.ros_control.video_provider:
             raise RuntimeError("No ROS video provider available")
 
+        stream = self._video_streams.get(fps)
+        if stream is None:
+            stream = self._build_video_stream(fps)
+            self._video_streams[fps] = stream
+        return stream
+
+    def _build_video_stream(self, fps: int) -> Observable:
+        """Build the shared processing pipeline for get_ros_video_stream."""
         print(f"Starting ROS video stream at {fps} FPS...")
 
         # Get base stream from video provider
         video_stream = self.ros_control.video_provider.capture_video_as_observable(
             fps=fps)
 
-        # Add minimal processing pipeline with proper thread handling
+        # Add minimal processing pipeline. The provider already delivers frames on the
+        # pool, so no extra observe_on hop is added here; consumers that need their
+        # own thread can add one.
         processed_stream = video_stream.pipe(
             ops.subscribe_on(self.pool_scheduler),
-            ops.observe_on(self.pool_scheduler),  # Ensure thread safety
+            # Frames are shared between all subscribers without copying
+            ops.do_action(_mark_read_only),
             ops.share()  # Share the stream
         )
 
@@ -221,10 +325,11 @@ class Robot(ABC):
         Raises:
             RuntimeError: If no ROS control interface is available.
         """
-        if self.ros_control is None:
+        fn = self._rc_spin
+        if fn is None:
             raise RuntimeError(
                 "No ROS control interface available for rotation")
-        return self.ros_control.spin(degrees, speed)
+        return fn(degrees, speed)
 
     def webrtc_req(self, api_id: int, topic: str = None, parameter: str = '', 
                   priority: int = 0, request_id: str = None, data=None, timeout: float = 1000.0) -> bool:
@@ -245,17 +350,12 @@ class Robot(ABC):
             RuntimeError: If no ROS control interface is available.
 
         """
-        if self.ros_control is None:
+        fn = self._rc_queue_webrtc_req
+        if fn is None:
             raise RuntimeError("No ROS control interface available for WebRTC commands")
-        return self.ros_control.queue_webrtc_req(
-            api_id=api_id, 
-            topic=topic,
-            parameter=parameter, 
-            priority=priority,
-            request_id=request_id,
-            data=data,
-            timeout=timeout
-        )
+        # Positional in ROSControl.queue_webrtc_req order: (api_id, topic, parameter,
+        # priority, timeout, request_id, data)
+        return fn(api_id, topic, parameter, priority, timeout, request_id, data)
 
     def move_vel(self, x: float, y: float, yaw: float, duration: float = 0.0) -> bool:
         """Move the robot using direct movement commands.
@@ -272,9 +372,10 @@ class Robot(ABC):
         Raises:
             RuntimeError: If no ROS control interface is available.
         """
-        if self.ros_control is None:
+        fn = self._rc_move_vel
+        if fn is None:
             raise RuntimeError("No ROS control interface available for movement")
-        return self.ros_control.move_vel(x, y, yaw, duration)
+        return fn(x, y, yaw, duration)
     
     def pose_command(self, roll: float, pitch: float, yaw: float) -> bool:
         """Send a pose command to the robot.
@@ -290,9 +391,10 @@ class Robot(ABC):
         Raises:
             RuntimeError: If no ROS control interface is available.
         """
-        if self.ros_control is None:
+        fn = self._rc_pose_command
+        if fn is None:
             raise RuntimeError("No ROS control interface available for pose commands")
-        return self.ros_control.pose_command(roll, pitch, yaw)
+        return fn(roll, pitch, yaw)
 
     def update_hardware_interface(self,
                                   new_hardware_interface: HardwareInterface):
@@ -330,12 +432,20 @@ class Robot(ABC):
 
     
     def get_spatial_memory(self) -> Optional[SpatialMemory]:
-        """Simple getter for the spatial memory instance.
+        """Getter for the spatial memory instance, creating it on first call.
         
         Returns:
             The spatial memory instance or None if not set.
         """
+        if self._spatial_memory is None:
+            with self._spatial_memory_lock:
+                if self._spatial_memory is None:
+                    self._spatial_memory = self._create_spatial_memory()
         return self._spatial_memory if self._spatial_memory else None
+
+    def prime_spatial_memory(self) -> None:
+        """Create the spatial memory now, so it starts recording frames immediately."""
+        self.get_spatial_memory()
     
 
         
@@ -346,13 +456,15 @@ class Robot(ABC):
         ensure proper release of resources such as ROS connections and
         subscriptions.
         """
+        logger.debug("Cleaning up robot resources")
         # Dispose of resources
         if self.disposables:
             self.disposables.dispose()
+            self.disposables = None
+        self._video_streams.clear()
         
         if self.ros_control:
             self.ros_control.cleanup()
-        self.disposables.dispose()
 
 class MockRobot(Robot):
     def __init__(self):
@@ -95,6 +95,9 @@ class ROSCommandQueue:
         # Command execution status
         self._should_stop = False
         self._queue_thread = None
+        # Set when a command is queued or the robot state changes, so the
+        # processing thread reacts without waiting out its poll interval
+        self._wakeup = threading.Event()
         
         # Stats
         self._command_count = 0
@@ -129,6 +132,7 @@ class ROSCommandQueue:
             return
             
         self._should_stop = True
+        self._wakeup.set()
         try:
             self._queue_thread.join(timeout=timeout)
             if self._queue_thread.is_alive():
@@ -137,6 +141,10 @@ class ROSCommandQueue:
                 logger.info("Queue processing thread stopped")
         except Exception as e:
             logger.error(f"Error stopping queue processing thread: {e}")
+
+    def notify_state_change(self):
+        """Wake the processing thread after the robot's ready/busy state changed"""
+        self._wakeup.set()
         
     def queue_webrtc_request(self, api_id: int, topic: str = None, parameter: str = '', 
                              request_id: str = None, data: Dict[str, Any] = None,
@@ -182,22 +190,23 @@ class ROSCommandQueue:
                     logger.debug(f"[WebRTC Queue] Request API ID {api_id} sent SUCCESSFULLY")
                 
                 # Allow time for the robot to process the command
-                start_time = time.time()
+                start_time = time.monotonic()
                 stabilization_delay = 0.5  # Half-second delay for stabilization
                 time.sleep(stabilization_delay)
                 
                 # Wait for the robot to complete the command (timeout check)
-                while self._is_busy_func() and (time.time() - start_time) < timeout:
-                    if self._debug and (time.time() - start_time) % 5 < 0.1:  # Print every ~5 seconds
-                        logger.debug(f"[WebRTC Queue] Still waiting on API ID {api_id} - elapsed: {time.time()-start_time:.1f}s")
-                    time.sleep(0.1)
+                while self._is_busy_func() and (time.monotonic() - start_time) < timeout:
+                    if self._debug and (time.monotonic() - start_time) % 5 < 0.1:  # Print every ~5 seconds
+                        logger.debug(f"[WebRTC Queue] Still waiting on API ID {api_id} - elapsed: {time.monotonic()-start_time:.1f}s")
+                    self._wakeup.wait(0.1)
+                    self._wakeup.clear()
                 
                 # Check if we timed out
-                if self._is_busy_func() and (time.time() - start_time) >= timeout:
+                if self._is_busy_func() and (time.monotonic() - start_time) >= timeout:
                     logger.warning(f"WebRTC request timed out: {api_id} (ID: {request_id})")
                     return False
                 
-                wait_time = time.time() - start_time
+                wait_time = time.monotonic() - start_time
                 if self._debug:
                     logger.debug(f"[WebRTC Queue] Request API ID {api_id} completed after {wait_time:.1f}s")
                 
@@ -222,6 +231,7 @@ class ROSCommandQueue:
         # Queue the command
         self._queue.put((priority, self._command_count, command))
         self._command_count += 1
+        self._wakeup.set()
         if self._debug:
             logger.debug(f"[WebRTC Queue] Added request ID {request_id} for API ID {api_id} - Queue size now: {self.queue_size}")
         logger.info(f"Queued WebRTC request: {api_id} (ID: {request_id}, Priority: {priority})")
@@ -258,6 +268,7 @@ class ROSCommandQueue:
         # Queue the command
         self._queue.put((priority, self._command_count, command))
         self._command_count += 1
+        self._wakeup.set()
         
         action_params = ', '.join([f"{k}={v}" for k, v in kwargs.items()])
         logger.info(f"Queued action request: {action_name} (ID: {request_id}, Priority: {priority}, Params: {action_params})")
@@ -270,12 +281,14 @@ class ROSCommandQueue:
         logger.info("[WebRTC Queue] Processing thread started")
         
         while not self._should_stop:
+            self._wakeup.clear()
+
             # Print queue status
             self._print_queue_status()
             
             # Check if we're ready to process a command
             if not self._queue.empty() and self._current_command is None:
-                current_time = time.time()
+                current_time = time.monotonic()
                 is_ready = self._is_ready_func()
                 is_busy = self._is_busy_func() if self._is_busy_func else False
                 
@@ -357,7 +370,7 @@ class ROSCommandQueue:
                                 'type': command.cmd_type.name,
                                 'params': command.params,
                                 'success': success,
-                                'time': time.time() - self._last_command_time
+                                'time': time.monotonic() - self._last_command_time
                             })
                             
                         except Exception as e:
@@ -375,14 +388,14 @@ class ROSCommandQueue:
                     except Empty:
                         pass
             
-            # Sleep to avoid busy-waiting
-            time.sleep(0.1)
+            # Wait for a new command or state change, polling at most every 0.1s
+            self._wakeup.wait(0.1)
         
         logger.info("Queue processing stopped")
         
     def _print_queue_status(self):
         """Print the current queue status"""
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Only print once per second to avoid spamming the log
         if current_time - self._last_command_time < 1.0 and self._current_command is None:
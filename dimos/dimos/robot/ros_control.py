@@ -14,24 +14,22 @@
 
 import rclpy
 from rclpy.node import Node
-from rclpy.executors import MultiThreadedExecutor
+from rclpy.executors import SingleThreadedExecutor
 from rclpy.action import ActionClient
+from rclpy.serialization import deserialize_message
 from geometry_msgs.msg import Twist
 from nav2_msgs.action import Spin
 
 from sensor_msgs.msg import Image, CompressedImage
-from cv_bridge import CvBridge
+import cv2
+import numpy as np
 from enum import Enum, auto
 import threading
 import time
+import functools
+import logging
 from typing import Optional, Tuple, Dict, Any, Type
 from abc import ABC, abstractmethod
-from rclpy.qos import (
-    QoSProfile,
-    QoSReliabilityPolicy,
-    QoSHistoryPolicy,
-    QoSDurabilityPolicy,
-)
 from dimos.stream.ros_video_provider import ROSVideoProvider
 import math
 from builtin_interfaces.msg import Duration
@@ -43,7 +41,7 @@ from nav_msgs.msg import OccupancyGrid
 
 import tf2_ros
 from dimos.robot.ros_transform import ROSTransformAbility
-from dimos.robot.ros_observable_topic import ROSObservableTopicAbility
+from dimos.robot.ros_observable_topic import ROSObservableTopicAbility, SENSOR_QOS, COMMAND_QOS
 
 from nav_msgs.msg import Odometry
 
@@ -61,8 +59,107 @@ class RobotMode(Enum):
     MOVING = auto()
     ERROR = auto()
 
+def _clamp_velocities(x: float, y: float, yaw: float, max_linear: float, max_angular: float) -> Tuple[float, float, float]:
+    """Clamp a velocity command to safe limits using plain comparisons (no min/max calls)."""
+    x = max_linear if x > max_linear else (-max_linear if x < -max_linear else x)
+    y = max_linear if y > max_linear else (-max_linear if y < -max_linear else y)
+    yaw = max_angular if yaw > max_angular else (-max_angular if yaw < -max_angular else yaw)
+    return float(x), float(y), float(yaw)
+
+
+@functools.lru_cache(maxsize=16)
+def _action_duration(sec: int) -> Duration:
+    """Shared Duration for an action time allowance; treat the result as read-only."""
+    return Duration(sec=sec)
+
+
+class _LatestSerializedMessage:
+    """Keeps the latest serialized message and deserializes it only when read."""
+
+    def __init__(self, msg_type: Type):
+        self.msg_type = msg_type
+        self.raw = None
+        self._decoded = (None, None)  # (raw, message) pair, replaced atomically
+
+    def get(self):
+        raw = self.raw
+        if raw is None:
+            return None
+        decoded_raw, msg = self._decoded
+        if decoded_raw is not raw:
+            msg = deserialize_message(raw, self.msg_type)
+            self._decoded = (raw, msg)
+        return msg
+
+
 class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
     """Abstract base class for ROS-controlled robots"""
+
+    # Converted camera frames are written into this many reused buffers, so a
+    # consumer that keeps a frame longer than that many frames must copy it
+    FRAME_RING_SIZE = 8
+
+    # Velocity commands arriving faster than this are coalesced; only the latest is published
+    TWIST_MIN_INTERVAL = 0.01
+
+    # Fixed attribute layout; callbacks read these on every message
+    __slots__ = (
+        "_state_topic",
+        "_imu_topic",
+        "_odom_topic",
+        "_costmap_topic",
+        "_global_costmap_topic",
+        "_state_msg_type",
+        "_imu_msg_type",
+        "_webrtc_msg_type",
+        "_webrtc_topic",
+        "_webrtc_api_topic",
+        "_node",
+        "_debug",
+        "_executor",
+        "MAX_LINEAR_VELOCITY",
+        "MAX_ANGULAR_VELOCITY",
+        "_subscriptions",
+        "_robot_state",
+        "_imu_state",
+        "_odom_data",
+        "_costmap_data",
+        "_global_costmap_data",
+        "_mode",
+        "_state_sub",
+        "_imu_sub",
+        "_odom_sub",
+        "_costmap_sub",
+        "_global_costmap_sub",
+        "_video_provider",
+        "_bridge",
+        "_frame_ring",
+        "_ring_idx",
+        "_spin_client",
+        "_spin_goal",
+        "_action_success",
+        "_action_done",
+        "_move_vel_pub",
+        "_pose_pub",
+        "_webrtc_pub",
+        "_twist_cmd",
+        "_vec3_cmd",
+        "_cmd_lock",
+        "_pending_twist",
+        "_last_twist_time",
+        "_twist_flush_timer",
+        "_command_queue",
+        "_spin_thread",
+        "_current_velocity",
+        "_is_moving",
+        # Created lazily by ROSTransformAbility.tf_buffer
+        "_tf_buffer",
+        "_tf_listener",
+        # Created lazily by ROSObservableTopicAbility.topic
+        "_topic_cache",
+        "_topic_schedulers",
+    )
+
     def __init__(self, 
                  node_name: str,
                  camera_topics: Dict[str, str] = None,
@@ -118,44 +215,36 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         self._global_costmap_topic = global_costmap_topic
         self._debug = debug
 
-        # Prepare a multi-threaded executor
-        self._executor = MultiThreadedExecutor()
+        # All callbacks share the node's default mutually exclusive callback group and
+        # only store or forward messages, so a single-threaded executor runs them with
+        # the same concurrency as a multi-threaded one, minus its per-iteration overhead.
+        # Action goals are awaited on the command queue thread, not inside a callback.
+        self._executor = SingleThreadedExecutor()
 
         # Movement constraints
         self.MAX_LINEAR_VELOCITY = max_linear_velocity
         self.MAX_ANGULAR_VELOCITY = max_angular_velocity
 
         self._subscriptions = []
+        # Created below when a WebRTC message type is given; state callbacks may run first
+        self._command_queue = None
 
         # Track State variables
         self._robot_state = None  # Full state message
         self._imu_state = None  # Full IMU message
         self._odom_data = None  # Odometry data
-        self._costmap_data = None  # Costmap data
+        # Costmaps are stored serialized and only deserialized when read
+        self._costmap_data = _LatestSerializedMessage(OccupancyGrid)
         self._mode = RobotMode.INITIALIZING
 
-        # Create sensor data QoS profile
-        sensor_qos = QoSProfile(
-            reliability=QoSReliabilityPolicy.BEST_EFFORT,
-            history=QoSHistoryPolicy.KEEP_LAST,
-            durability=QoSDurabilityPolicy.VOLATILE,
-            depth=1,
-        )
-
-        command_qos = QoSProfile(
-            reliability=QoSReliabilityPolicy.RELIABLE,
-            history=QoSHistoryPolicy.KEEP_LAST,
-            durability=QoSDurabilityPolicy.VOLATILE,
-            depth=10,  # Higher depth for commands to ensure delivery
-        )
-
         if self._global_costmap_topic:
-            self._global_costmap_data = None
+            self._global_costmap_data = _LatestSerializedMessage(OccupancyGrid)
             self._global_costmap_sub = self._node.create_subscription(
                 OccupancyGrid,
                 self._global_costmap_topic,
                 self._global_costmap_callback,
-                sensor_qos,
+                SENSOR_QOS,
+                raw=True,
             )
             self._subscriptions.append(self._global_costmap_sub)
         else:
@@ -165,9 +254,11 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
 
         # Initialize data handling
         self._video_provider = None
+        # CvBridge is only needed for raw encodings other than bgr8/rgb8; created on first use
         self._bridge = None
+        self._frame_ring = []
+        self._ring_idx = 0
         if camera_topics:
-            self._bridge = CvBridge()
             self._video_provider = ROSVideoProvider(dev_name=f"{node_name}_video")
 
             # Create subscribers for each topic with sensor QoS
@@ -175,11 +266,20 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
                 topic = camera_config["topic"]
                 msg_type = camera_config["type"]
 
+                # Pick the conversion per topic so the frame callback does not dispatch on type
+                if msg_type is CompressedImage:
+                    image_callback = self._compressed_image_callback
+                elif msg_type is Image:
+                    image_callback = self._image_callback
+                else:
+                    logger.error(f"Unsupported image message type for {topic}: {msg_type.__name__}")
+                    continue
+
                 logger.info(
                     f"Subscribing to {topic} with BEST_EFFORT QoS using message type {msg_type.__name__}"
                 )
                 _camera_subscription = self._node.create_subscription(
-                    msg_type, topic, self._image_callback, sensor_qos
+                    msg_type, topic, image_callback, SENSOR_QOS
                 )
                 self._subscriptions.append(_camera_subscription)
 
@@ -190,7 +290,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
                 self._state_msg_type,
                 self._state_topic,
                 self._state_callback,
-                qos_profile=sensor_qos,
+                qos_profile=SENSOR_QOS,
             )
             self._subscriptions.append(self._state_sub)
         else:
@@ -200,7 +300,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
 
         if self._imu_topic and self._imu_msg_type:
             self._imu_sub = self._node.create_subscription(
-                self._imu_msg_type, self._imu_topic, self._imu_callback, sensor_qos
+                self._imu_msg_type, self._imu_topic, self._imu_callback, SENSOR_QOS
             )
             self._subscriptions.append(self._imu_sub)
         else:
@@ -211,7 +311,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
                 Odometry,
                 self._odom_topic,
                 self._odom_callback,
-                sensor_qos
+                SENSOR_QOS
             )
             self._subscriptions.append(self._odom_sub)
         else:
@@ -222,7 +322,8 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
                 OccupancyGrid,
                 self._costmap_topic,
                 self._costmap_callback,
-                sensor_qos
+                SENSOR_QOS,
+                raw=True,
             )
             self._subscriptions.append(self._costmap_sub)
         else:
@@ -230,6 +331,11 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
 
         # Nav2 Action Clients
         self._spin_client = ActionClient(self._node, Spin, "spin")
+        # Actions run one at a time on the command queue, so a single Spin goal is reused
+        self._spin_goal = Spin.Goal()
+        # Set by the goal callbacks once the current action is rejected or finished
+        self._action_success = None
+        self._action_done = threading.Event()
 
         # Wait for action servers
         if not mock_connection:
@@ -237,13 +343,24 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
 
         # Publishers
         self._move_vel_pub = self._node.create_publisher(
-            Twist, move_vel_topic, command_qos
+            Twist, move_vel_topic, COMMAND_QOS
         )
-        self._pose_pub = self._node.create_publisher(Vector3, pose_topic, command_qos)
+        self._pose_pub = self._node.create_publisher(Vector3, pose_topic, COMMAND_QOS)
+
+        # Command messages are reused across calls; publish() serializes them
+        # synchronously, and the lock keeps concurrent callers from interleaving
+        self._twist_cmd = Twist()
+        self._vec3_cmd = Vector3()
+        self._cmd_lock = threading.Lock()
+        self._pending_twist = None
+        self._last_twist_time = 0.0
+        # One executor timer publishes coalesced commands; it stays cancelled while idle
+        self._twist_flush_timer = self._node.create_timer(self.TWIST_MIN_INTERVAL, self._flush_pending_twist)
+        self._twist_flush_timer.cancel()
 
         if webrtc_msg_type:
             self._webrtc_pub = self._node.create_publisher(
-                webrtc_msg_type, webrtc_topic, qos_profile=command_qos
+                webrtc_msg_type, webrtc_topic, qos_profile=COMMAND_QOS
             )
 
             # Initialize command queue
@@ -266,8 +383,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         self._spin_thread = threading.Thread(target=self._ros_spin, daemon=True)
         self._spin_thread.start()
 
-        logger.info(f"{node_name} initialized with multi-threaded executor")
-        print(f"{node_name} initialized with multi-threaded executor")
+        logger.info(f"{node_name} initialized with single-threaded executor")
 
     def get_global_costmap(self) -> Optional[OccupancyGrid]:
         """
@@ -282,37 +398,34 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
             )
             return None
 
-        if self._global_costmap_data:
-            return self._global_costmap_data
-        else:
-            return None
+        return self._global_costmap_data.get()
 
     def _global_costmap_callback(self, msg):
-        """Callback for costmap data"""
-        self._global_costmap_data = msg
+        """Callback for serialized costmap data"""
+        self._global_costmap_data.raw = msg
 
     def _imu_callback(self, msg):
         """Callback for IMU data"""
         self._imu_state = msg
-        # Log IMU state (very verbose)
-        #logger.debug(f"IMU state updated: {self._imu_state}")
 
     def _odom_callback(self, msg):
         """Callback for odometry data"""
         self._odom_data = msg
             
     def _costmap_callback(self, msg):
-        """Callback for costmap data"""
-        self._costmap_data = msg
+        """Callback for serialized costmap data"""
+        self._costmap_data.raw = msg
 
     def _state_callback(self, msg):
         """Callback for state messages to track mode and progress"""
 
         # Call the abstract method to update RobotMode enum based on the received state
         self._robot_state = msg
+        previous_mode = self._mode
         self._update_mode(msg)
-        # Log state changes (very verbose)
-        # logger.debug(f"Robot state updated: {self._robot_state}")
+        # Wake the command queue as soon as the robot becomes ready or busy
+        if self._mode is not previous_mode and self._command_queue is not None:
+            self._command_queue.notify_state_change()
 
     @property
     def robot_state(self) -> Optional[Any]:
@@ -320,7 +433,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         return self._robot_state
 
     def _ros_spin(self):
-        """Background thread for spinning the multi-threaded executor."""
+        """Background thread for spinning the executor."""
         self._executor.add_node(self._node)
         try:
             self._executor.spin()
@@ -329,7 +442,11 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
 
     def _clamp_velocity(self, velocity: float, max_velocity: float) -> float:
         """Clamp velocity within safe limits"""
-        return max(min(velocity, max_velocity), -max_velocity)
+        if velocity > max_velocity:
+            return max_velocity
+        if velocity < -max_velocity:
+            return -max_velocity
+        return velocity
 
     @abstractmethod
     def _update_mode(self, *args, **kwargs):
@@ -393,23 +510,49 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         if not self._costmap_topic:
             logger.warning("No costmap topic provided - costmap data tracking will be unavailable")
             return None
-        return self._costmap_data
+        return self._costmap_data.get()
     
-    def _image_callback(self, msg):
+    def _image_callback(self, msg: Image):
         """Convert ROS image to numpy array and push to data stream"""
-        if self._video_provider and self._bridge:
-            try:
-                if isinstance(msg, CompressedImage):
-                    frame = self._bridge.compressed_imgmsg_to_cv2(msg)
-                elif isinstance(msg, Image):
-                    frame = self._bridge.imgmsg_to_cv2(msg, "bgr8")
-                else:
-                    logger.error(f"Unsupported image message type: {type(msg)}")
-                    return
-                self._video_provider.push_data(frame)
-            except Exception as e:
-                logger.error(f"Error converting image: {e}")
-                print(f"Full conversion error: {str(e)}")
+        try:
+            self._video_provider.push_data(self._image_msg_to_bgr(msg))
+        except Exception as e:
+            logger.error(f"Error converting image: {e}")
+
+    def _compressed_image_callback(self, msg: CompressedImage):
+        """Decode ROS compressed image and push to data stream"""
+        try:
+            frame = cv2.imdecode(np.frombuffer(msg.data, dtype=np.uint8), cv2.IMREAD_COLOR)
+            self._video_provider.push_data(frame)
+        except Exception as e:
+            logger.error(f"Error converting image: {e}")
+
+    def _image_msg_to_bgr(self, msg: Image) -> np.ndarray:
+        """Wrap an unpadded bgr8/rgb8 Image payload without copying, falling back to CvBridge otherwise."""
+        if msg.encoding in ("bgr8", "rgb8") and msg.step == msg.width * 3:
+            # View over the message buffer; an RGB->BGR swap is written into the frame ring
+            frame = np.frombuffer(msg.data, dtype=np.uint8).reshape(msg.height, msg.width, 3)
+            if msg.encoding == "rgb8":
+                frame = cv2.cvtColor(frame, cv2.COLOR_RGB2BGR, dst=self._next_frame_slot(frame.shape))
+            return frame
+        if self._bridge is None:
+            from cv_bridge import CvBridge
+
+            self._bridge = CvBridge()
+        return self._bridge.imgmsg_to_cv2(msg, "bgr8")
+
+    def _next_frame_slot(self, shape: Tuple[int, ...]) -> np.ndarray:
+        """Return the next preallocated frame buffer, reallocating the ring if the frame size changed."""
+        ring = self._frame_ring
+        if not ring or ring[0].shape != shape:
+            ring = [np.empty(shape, dtype=np.uint8) for _ in range(self.FRAME_RING_SIZE)]
+            self._frame_ring = ring
+            self._ring_idx = 0
+        slot = ring[self._ring_idx]
+        # Downstream streams mark emitted frames read-only; the ring owns the buffer
+        slot.setflags(write=True)
+        self._ring_idx = (self._ring_idx + 1) % len(ring)
+        return slot
 
     @property
     def video_provider(self) -> Optional[ROSVideoProvider]:
@@ -434,11 +577,13 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         if description:
             logger.info(description)
 
-        print(f"[ROSControl] Sending action client goal: {description}")
-        print(f"[ROSControl] Goal message: {goal_msg}")
+        # The goal repr is large; only build it when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Sending action client goal: {description}, goal message: {goal_msg}")
 
         # Reset action result tracking
         self._action_success = None
+        self._action_done.clear()
 
         # Send the goal
         send_goal_future = client.send_goal_async(
@@ -447,16 +592,10 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         send_goal_future.add_done_callback(self._goal_response_callback)
 
         # Wait for completion
-        start_time = time.time()
-        while (
-            self._action_success is None and time.time() - start_time < time_allowance
-        ):
-            time.sleep(0.1)
-
-        elapsed = time.time() - start_time
-        print(
-            f"[ROSControl] Action completed in {elapsed:.2f}s with result: {self._action_success}"
-        )
+        start_time = time.monotonic()
+        self._action_done.wait(time_allowance)
+
+        logger.debug("Action completed in %.2fs with result: %s", time.monotonic() - start_time, self._action_success)
 
         # Check result
         if self._action_success is None:
@@ -498,7 +637,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
                 goal.target.y = 0.0
                 goal.target.z = 0.0
                 goal.speed = speed
-                goal.time_allowance = Duration(sec=time_allowance)
+                goal.time_allowance = _action_duration(int(time_allowance))
 
                 logger.info(f"Moving forward: distance={distance}m, speed={speed}m/s")
 
@@ -560,14 +699,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
                 goal.target.y = 0.0
                 goal.target.z = 0.0
                 goal.speed = speed  # BackUp expects positive speed
-                goal.time_allowance = Duration(sec=time_allowance)
-
-                print(
-                    f"[ROSControl] execute_reverse: Creating BackUp goal with distance={distance}m, speed={speed}m/s"
-                )
-                print(
-                    f"[ROSControl] execute_reverse: Goal details: x={goal.target.x}, y={goal.target.y}, z={goal.target.z}, speed={goal.speed}"
-                )
+                goal.time_allowance = _action_duration(int(time_allowance))
 
                 logger.info(f"Moving backward: distance={distance}m, speed={speed}m/s")
 
@@ -578,7 +710,7 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
                     time_allowance,
                 )
 
-                print(f"[ROSControl] execute_reverse: BackUp action result: {result}")
+                logger.debug("BackUp action result: %s", result)
                 return result
 
             # Queue the action
@@ -629,10 +761,10 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
 
             # Define function to execute the spin
             def execute_spin():
-                # Create Spin goal
-                goal = Spin.Goal()
+                # Fill in the reusable Spin goal
+                goal = self._spin_goal
                 goal.target_yaw = angle  # Nav2 Spin action expects radians
-                goal.time_allowance = Duration(sec=time_allowance)
+                goal.time_allowance = _action_duration(int(time_allowance))
 
                 logger.info(f"Spinning: angle={degrees}deg ({angle:.2f}rad)")
 
@@ -669,12 +801,11 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         goal_handle = future.result()
         if not goal_handle.accepted:
             logger.warn("Goal was rejected!")
-            print("[ROSControl] Goal was REJECTED by the action server")
             self._action_success = False
+            self._action_done.set()
             return
 
         logger.info("Goal accepted")
-        print("[ROSControl] Goal was ACCEPTED by the action server")
         result_future = goal_handle.get_result_async()
         result_future.add_done_callback(self._goal_result_callback)
 
@@ -683,12 +814,12 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         try:
             result = future.result().result
             logger.info("Goal completed")
-            print(f"[ROSControl] Goal COMPLETED with result: {result}")
+            logger.debug("Goal result: %s", result)
             self._action_success = True
         except Exception as e:
             logger.error(f"Goal failed with error: {e}")
-            print(f"[ROSControl] Goal FAILED with error: {e}")
             self._action_success = False
+        self._action_done.set()
 
     def stop(self) -> bool:
         """Stop all robot movement"""
@@ -821,32 +952,87 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
             bool: True if command was sent successfully
         """
         # Clamp velocities to safe limits
-        x = self._clamp_velocity(x, self.MAX_LINEAR_VELOCITY)
-        y = self._clamp_velocity(y, self.MAX_LINEAR_VELOCITY)
-        yaw = self._clamp_velocity(yaw, self.MAX_ANGULAR_VELOCITY)
-
-        # Create and send command
-        cmd = Twist()
-        cmd.linear.x = float(x)
-        cmd.linear.y = float(y)
-        cmd.angular.z = float(yaw)
+        x, y, yaw = _clamp_velocities(x, y, yaw, self.MAX_LINEAR_VELOCITY, self.MAX_ANGULAR_VELOCITY)
 
         try:
             if duration > 0:
-                start_time = time.time()
-                while time.time() - start_time < duration:
-                    self._move_vel_pub.publish(cmd)
-                    time.sleep(0.1)  # 10Hz update rate
+                # Timed moves keep their own message so other callers cannot change it mid-loop
+                cmd = Twist()
+                cmd.linear.x = x
+                cmd.linear.y = y
+                cmd.angular.z = yaw
+                self._move_vel_pub.publish(cmd)
+
+                # Republish at 10Hz from an executor timer until the monotonic deadline
+                deadline = time.monotonic() + duration
+                finished = threading.Event()
+
+                def _republish():
+                    try:
+                        if time.monotonic() < deadline:
+                            self._move_vel_pub.publish(cmd)
+                            return
+                    except Exception as e:
+                        logger.error(f"Failed to send movement command: {e}")
+                    finished.set()
+
+                timer = self._node.create_timer(0.1, _republish)
+                try:
+                    finished.wait(duration + 1.0)
+                finally:
+                    self._node.destroy_timer(timer)
                 # Stop after duration
                 self.stop()
             else:
-                self._move_vel_pub.publish(cmd)
+                self._publish_twist(x, y, yaw)
             return True
 
         except Exception as e:
-            self._logger.error(f"Failed to send movement command: {e}")
+            logger.error(f"Failed to send movement command: {e}")
             return False
 
+    def _publish_twist(self, x: float, y: float, yaw: float):
+        """
+        Publish a velocity command, coalescing commands sent within TWIST_MIN_INTERVAL.
+
+        The first command of a burst is published immediately; later ones replace a
+        pending command that the flush timer publishes one interval later, so the most
+        recent command (e.g. a stop) is always sent. The timer runs on the ROS executor
+        and is only armed while a command is pending.
+        """
+        with self._cmd_lock:
+            now = time.monotonic()
+            wait = self._last_twist_time + self.TWIST_MIN_INTERVAL - now
+            if wait <= 0.0:
+                self._pending_twist = None
+                self._send_twist(x, y, yaw, now)
+                return
+            if self._pending_twist is None:
+                self._twist_flush_timer.reset()
+            self._pending_twist = (x, y, yaw)
+
+    def _flush_pending_twist(self):
+        """Publish the command left pending by _publish_twist, if any, and disarm the timer."""
+        try:
+            with self._cmd_lock:
+                self._twist_flush_timer.cancel()
+                pending = self._pending_twist
+                if pending is None:
+                    return
+                self._pending_twist = None
+                self._send_twist(*pending, time.monotonic())
+        except Exception as e:
+            logger.error(f"Failed to send velocity command: {e}")
+
+    def _send_twist(self, x: float, y: float, yaw: float, now: float):
+        """Publish using the preallocated Twist message; caller holds _cmd_lock."""
+        cmd = self._twist_cmd
+        cmd.linear.x = x
+        cmd.linear.y = y
+        cmd.angular.z = yaw
+        self._move_vel_pub.publish(cmd)
+        self._last_twist_time = now
+
     def move_vel_control(self, x: float, y: float, yaw: float) -> bool:
         """
         Send a single velocity command without duration handling.
@@ -860,18 +1046,10 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
             bool: True if command was sent successfully
         """
         # Clamp velocities to safe limits
-        x = self._clamp_velocity(x, self.MAX_LINEAR_VELOCITY)
-        y = self._clamp_velocity(y, self.MAX_LINEAR_VELOCITY)
-        yaw = self._clamp_velocity(yaw, self.MAX_ANGULAR_VELOCITY)
-
-        # Create and send command
-        cmd = Twist()
-        cmd.linear.x = float(x)
-        cmd.linear.y = float(y)
-        cmd.angular.z = float(yaw)
+        x, y, yaw = _clamp_velocities(x, y, yaw, self.MAX_LINEAR_VELOCITY, self.MAX_ANGULAR_VELOCITY)
 
         try:
-            self._move_vel_pub.publish(cmd)
+            self._publish_twist(x, y, yaw)
             return True
         except Exception as e:
             logger.error(f"Failed to send velocity command: {e}")
@@ -889,15 +1067,14 @@ class ROSControl(ROSTransformAbility, ROSObservableTopicAbility, ABC):
         Returns:
             bool: True if command was sent successfully
         """
-        # Create the pose command message
-        cmd = Vector3()
-        cmd.x = float(roll)  # Roll
-        cmd.y = float(pitch)  # Pitch
-        cmd.z = float(yaw)  # Yaw
-
         try:
-            self._pose_pub.publish(cmd)
-            logger.debug(f"Sent pose command: roll={roll}, pitch={pitch}, yaw={yaw}")
+            with self._cmd_lock:
+                cmd = self._vec3_cmd
+                cmd.x = float(roll)  # Roll
+                cmd.y = float(pitch)  # Pitch
+                cmd.z = float(yaw)  # Yaw
+                self._pose_pub.publish(cmd)
+            logger.debug("Sent pose command: roll=%s, pitch=%s, yaw=%s", roll, pitch, yaw)
             return True
         except Exception as e:
             logger.error(f"Failed to send pose command: {e}")
@@ -12,17 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import asyncio
-import functools
+import threading
 import enum
 import reactivex as rx
 from reactivex import operators as ops
 from reactivex.disposable import Disposable
 from reactivex.scheduler import ThreadPoolScheduler
-from rxpy_backpressure import BackPressure
 
 from nav_msgs import msg
 from dimos.utils.logging_config import setup_logger
-from dimos.utils.threadpool import get_scheduler
+from dimos.utils.threadpool import make_single_thread_scheduler
+from dimos.utils.reactive import observe_latest
 from dimos.types.costmap import Costmap
 from dimos.types.vector import Vector
 
@@ -35,37 +35,82 @@ from rclpy.qos import (
     QoSDurabilityPolicy,
 )
 
-__all__ = ["ROSObservableTopicAbility", "QOS"]
+__all__ = ["ROSObservableTopicAbility", "QOS", "SENSOR_QOS", "COMMAND_QOS"]
 
 ConversionType = Costmap
 TopicType = Union[ConversionType, msg.OccupancyGrid, msg.Odometry]
 
 
+# Shared, parameter-free profiles; rclpy only reads them when creating endpoints
+SENSOR_QOS = QoSProfile(
+    reliability=QoSReliabilityPolicy.BEST_EFFORT,
+    history=QoSHistoryPolicy.KEEP_LAST,
+    durability=QoSDurabilityPolicy.VOLATILE,
+    depth=1,
+)
+
+COMMAND_QOS = QoSProfile(
+    reliability=QoSReliabilityPolicy.RELIABLE,
+    history=QoSHistoryPolicy.KEEP_LAST,
+    durability=QoSDurabilityPolicy.VOLATILE,
+    depth=10,  # Higher depth for commands to ensure delivery
+)
+
+
 class QOS(enum.Enum):
     SENSOR = "sensor"
     COMMAND = "command"
 
-    def to_profile(self) -> QoSProfile:
-        if self == QOS.SENSOR:
-            return QoSProfile(
-                reliability=QoSReliabilityPolicy.BEST_EFFORT,
-                history=QoSHistoryPolicy.KEEP_LAST,
-                durability=QoSDurabilityPolicy.VOLATILE,
-                depth=1,
-            )
-        if self == QOS.COMMAND:
-            return QoSProfile(
-                reliability=QoSReliabilityPolicy.RELIABLE,
-                history=QoSHistoryPolicy.KEEP_LAST,
-                durability=QoSDurabilityPolicy.VOLATILE,
-                depth=10,  # Higher depth for commands to ensure delivery
-            )
+    def to_profile(self, depth: int | None = None) -> QoSProfile:
+        try:
+            profile = _PROFILES[self]
+        except KeyError:
+            raise ValueError(f"Unknown QoS enum value: {self}")
+
+        return _with_depth(profile, depth)
+
+
+_PROFILES = {QOS.SENSOR: SENSOR_QOS, QOS.COMMAND: COMMAND_QOS}
+
 
-        raise ValueError(f"Unknown QoS enum value: {self}")
+def _with_depth(profile: QoSProfile, depth: int | None) -> QoSProfile:
+    if depth is None or depth == profile.depth:
+        return profile
+
+    # Same policies with a different history depth, e.g. depth=1 for fire-and-forget commands
+    return QoSProfile(
+        reliability=profile.reliability,
+        history=profile.history,
+        durability=profile.durability,
+        depth=depth,
+    )
+
+
+def _qos_key(qos: Union[QOS, QoSProfile], depth: int | None):
+    if isinstance(qos, QoSProfile):
+        # by value, so equivalent profiles built by different callers share a topic core
+        return (qos.reliability, qos.history, qos.depth if depth is None else depth, qos.durability)
+    return (qos, depth)
 
 
 logger = setup_logger("dimos.robot.ros_control.observable_topic")
 
+# Message conversions applied in the ROS callback, resolved once per topic
+# (the Vector one is just for test, not sure if it is used irl)
+_CONVERSIONS = {
+    Costmap: Costmap.from_msg,
+    Vector: Vector.from_msg,
+}
+
+# ROS message type actually subscribed to for each converted type
+_SUB_MSG_TYPES = {
+    Costmap: msg.OccupancyGrid,
+    Vector: msg.Odometry,
+}
+
+# Guards the per-instance topic cache; topic() is called at setup time, not per message
+_topic_cache_lock = threading.Lock()
+
 
 class ROSObservableTopicAbility:
     # Ensures that we can return multiple observables which have multiple subscribers
@@ -77,42 +122,91 @@ class ROSObservableTopicAbility:
     #
     # (for more details see corresponding test file)
     #
-    # ROS thread ─► ReplaySubject─► observe_on(pool) ─► backpressure.latest ─► sub1 (fast)
-    #                          ├──► observe_on(pool) ─► backpressure.latest ─► sub2 (slow)
-    #                          └──► observe_on(pool) ─► backpressure.latest ─► sub3 (slower)
+    # ROS thread ─► ReplaySubject─► observe_latest ─► sub1 (fast)
+    #                          ├──► observe_latest ─► sub2 (slow)
+    #                          └──► observe_latest ─► sub3 (slower)
     #
+    __slots__ = ()
+
     def _maybe_conversion(self, msg_type: TopicType, callback) -> Callable[[TopicType], Any]:
-        if msg_type == Costmap:
-            return lambda msg: callback(Costmap.from_msg(msg))
-        # just for test, not sure if this Vector auto-instantiation is used irl
-        if msg_type == Vector:
-            return lambda msg: callback(Vector.from_msg(msg))
-        return callback
+        convert = _CONVERSIONS.get(msg_type)
+        if convert is None:
+            return callback
+        return lambda msg: callback(convert(msg))
 
     def _sub_msg_type(self, msg_type):
-        if msg_type == Costmap:
-            return msg.OccupancyGrid
-
-        if msg_type == Vector:
-            return msg.Odometry
-
-        return msg_type
+        return _SUB_MSG_TYPES.get(msg_type, msg_type)
 
-    @functools.lru_cache(maxsize=None)
     def topic(
         self,
         topic_name: str,
         msg_type: TopicType,
-        qos=QOS.SENSOR,
+        qos: Union[QOS, QoSProfile] = QOS.SENSOR,
         scheduler: ThreadPoolScheduler | None = None,
         drop_unprocessed: bool = True,
+        depth: int | None = None,
+        synchronous: bool = False,
     ) -> rx.Observable:
-        if scheduler is None:
-            scheduler = get_scheduler()
+        """
+        Observable of a ROS topic, backed by one shared ROS subscription per topic.
+
+        Args:
+            topic_name: Name of the ROS topic
+            msg_type: ROS message type, or a converted type such as Costmap or Vector
+            qos: QOS preset or an explicit rclpy QoSProfile
+            scheduler: Scheduler for subscribers without backpressure. If None, subscribers
+                of the topic share a single worker thread
+            drop_unprocessed: Skip messages a slow subscriber has not processed yet
+            depth: History depth overriding the one of the QoS profile
+            synchronous: Deliver messages directly on the ROS callback thread, skipping the
+                scheduler hop and backpressure. Only meant for fast subscribers, a slow one
+                blocks the ROS callbacks (and every other subscriber of the topic)
+        """
+        # one shared core (and so one ROS subscription) per topic, whatever the
+        # scheduler or backpressure settings of the individual callers
+        key = (topic_name, msg_type, _qos_key(qos, depth))
+        with _topic_cache_lock:
+            cache = getattr(self, "_topic_cache", None)
+            if cache is None:
+                cache = self._topic_cache = {}
+            core = cache.get(key)
+            if core is None:
+                qos_profile = _with_depth(qos, depth) if isinstance(qos, QoSProfile) else qos.to_profile(depth)
+                core = cache[key] = self._build_topic_core(topic_name, msg_type, qos_profile)
+
+        # synchronous subscribers run on the ROS callback thread, see the docstring
+        if synchronous:
+            return core
+
+        # without backpressure, subscribers of a topic that bring no scheduler share a
+        # single worker thread of that topic, so a slow subscriber on one topic cannot
+        # starve the subscribers of another in a shared pool
+        if not drop_unprocessed and scheduler is None:
+            scheduler = self._topic_scheduler(topic_name)
 
-        # Convert QOS to QoSProfile
-        qos_profile = qos.to_profile()
+        # per-subscriber factory
+        def per_sub():
+            # hop off the ROS thread onto a worker that only keeps the latest message
+            if drop_unprocessed:
+                return core.pipe(observe_latest())
+
+            # hop off the ROS thread into the pool
+            return core.pipe(ops.observe_on(scheduler))
 
+        # each `.subscribe()` call gets its own async backpressure chain
+        return rx.defer(lambda *_: per_sub())
+
+    def _topic_scheduler(self, topic_name: str) -> ThreadPoolScheduler:
+        with _topic_cache_lock:
+            schedulers = getattr(self, "_topic_schedulers", None)
+            if schedulers is None:
+                schedulers = self._topic_schedulers = {}
+            scheduler = schedulers.get(topic_name)
+            if scheduler is None:
+                scheduler = schedulers[topic_name] = make_single_thread_scheduler()
+            return scheduler
+
+    def _build_topic_core(self, topic_name: str, msg_type: TopicType, qos_profile: QoSProfile) -> rx.Observable:
         # upstream ROS callback
         def _on_subscribe(obs, _):
             ros_sub = self._node.create_subscription(
@@ -123,28 +217,11 @@ class ROSObservableTopicAbility:
         upstream = rx.create(_on_subscribe)
 
         # hot, latest-cached core
-        core = upstream.pipe(
+        return upstream.pipe(
             ops.replay(buffer_size=1),
             ops.ref_count(),  # still synchronous!
         )
 
-        # per-subscriber factory
-        def per_sub():
-            # hop off the ROS thread into the pool
-            base = core.pipe(ops.observe_on(scheduler))
-
-            # optional back-pressure handling
-            if not drop_unprocessed:
-                return base
-
-            def _subscribe(observer, sch=None):
-                return base.subscribe(BackPressure.LATEST(observer), scheduler=sch)
-
-            return rx.create(_subscribe)
-
-        # each `.subscribe()` call gets its own async backpressure chain
-        return rx.defer(lambda *_: per_sub())
-
     # If you are not interested in processing streams, just want to fetch the latest stream
     # value use this function. It runs a subscription in the background.
     # caches latest value for you, always ready to return.
@@ -172,19 +249,26 @@ class ROSObservableTopicAbility:
         core = self.topic(topic_name, msg_type, qos=qos).pipe(ops.replay(buffer_size=1))
         conn = core.connect()  # starts the ROS subscription immediately
 
-        try:
-            first_val = core.pipe(ops.first(), *([ops.timeout(timeout)] if timeout is not None else [])).run()
-        except Exception:
+        # the latest value lives in a closure cell: reads are a single LOAD_DEREF
+        latest = None
+        received = threading.Event()
+
+        def _on_next(v):
+            nonlocal latest
+            latest = v
+            received.set()
+
+        # one subscription both waits for the first value and keeps the cache current
+        sub = core.subscribe(_on_next)
+        if not received.wait(timeout):
+            sub.dispose()
             conn.dispose()
             msg = f"{topic_name} message not received after {timeout} seconds. Is robot connected?"
             logger.error(msg)
             raise Exception(msg)
 
-        cache = {"val": first_val}
-        sub = core.subscribe(lambda v: cache.__setitem__("val", v))
-
         def reader():
-            return cache["val"]
+            return latest
 
         reader.dispose = lambda: (sub.dispose(), conn.dispose())
         return reader
@@ -207,12 +291,13 @@ class ROSObservableTopicAbility:
     async def topic_latest_async(self, topic_name: str, msg_type: TopicType, qos=QOS.SENSOR, timeout: float = 30.0):
         loop = asyncio.get_running_loop()
         first = loop.create_future()
-        cache = {"val": None}
+        latest = None
 
         core = self.topic(topic_name, msg_type, qos=qos)  # single ROS callback
 
         def _on_next(v):
-            cache["val"] = v
+            nonlocal latest
+            latest = v
             if not first.done():
                 loop.call_soon_threadsafe(first.set_result, v)
 
@@ -225,7 +310,7 @@ class ROSObservableTopicAbility:
             raise
 
         def reader():
-            return cache["val"]
+            return latest
 
         reader.dispose = subscription.dispose
         return reader
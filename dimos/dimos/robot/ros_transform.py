@@ -12,7 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
+import numpy as np
 import rclpy
+import rclpy.time
+import rclpy.duration
 from typing import Optional
 from geometry_msgs.msg import TransformStamped
 from tf2_ros import Buffer
@@ -21,17 +25,25 @@ from tf2_geometry_msgs import PointStamped
 from dimos.utils.logging_config import setup_logger
 from dimos.types.vector import Vector
 from dimos.types.path import Path
+from dimos.robot._math_jit import quat_to_euler
 from scipy.spatial.transform import Rotation as R
 
 logger = setup_logger("dimos.robot.ros_transform")
 
 __all__ = ["ROSTransformAbility"]
 
+# Time() asks tf2 for the latest available transform; it is immutable, so one instance is shared
+_LATEST = rclpy.time.Time()
+
+
+@functools.lru_cache(maxsize=32)
+def _timeout_duration(timeout: float) -> rclpy.duration.Duration:
+    return rclpy.duration.Duration(seconds=timeout)
+
 
 def to_euler_rot(msg: TransformStamped) -> [Vector, Vector]:
     q = msg.transform.rotation
-    rotation = R.from_quat([q.x, q.y, q.z, q.w])
-    return Vector(rotation.as_euler("xyz", degrees=False))
+    return Vector(quat_to_euler(q.x, q.y, q.z, q.w))
 
 
 def to_euler_pos(msg: TransformStamped) -> [Vector, Vector]:
@@ -41,9 +53,32 @@ def to_euler(msg: TransformStamped) -> [Vector, Vector]:
     return [to_euler_pos(msg), to_euler_rot(msg)]
 
 
+def to_euler_rot_batch(msgs) -> np.ndarray:
+    """Euler angles (xyz, radians) of many transforms at once, as an (N, 3) array.
+
+    Same convention as to_euler_rot, with a single batched scipy conversion.
+    """
+    quats = np.array(
+        [(m.transform.rotation.x, m.transform.rotation.y, m.transform.rotation.z, m.transform.rotation.w) for m in msgs],
+        dtype=float,
+    ).reshape(-1, 4)
+    if len(quats) == 0:
+        return np.empty((0, 3))
+    return R.from_quat(quats).as_euler("xyz", degrees=False)
+
+
+def _rotation_translation(msg: TransformStamped) -> tuple[np.ndarray, np.ndarray]:
+    """3x3 rotation matrix and translation vector of a transform."""
+    q = msg.transform.rotation
+    t = msg.transform.translation
+    return R.from_quat([q.x, q.y, q.z, q.w]).as_matrix(), np.array([t.x, t.y, t.z])
+
+
 class ROSTransformAbility:
     """Mixin class for handling ROS transforms between coordinate frames"""
 
+    __slots__ = ()
+
     @property
     def tf_buffer(self) -> Buffer:
         if not hasattr(self, "_tf_buffer"):
@@ -70,8 +105,8 @@ class ROSTransformAbility:
             transform = self.tf_buffer.lookup_transform(
                 target_frame,
                 source_frame,
-                rclpy.time.Time(),
-                rclpy.duration.Duration(seconds=timeout),
+                _LATEST,
+                _timeout_duration(timeout),
             )
             return transform
         except (
@@ -95,21 +130,16 @@ class ROSTransformAbility:
             The transformed point as a Vector, or None if the transform failed
         """
         try:
-            # Wait for transform to become available
-            self.tf_buffer.can_transform(
-                target_frame, source_frame, rclpy.time.Time(), rclpy.duration.Duration(seconds=timeout)
-            )
-
             # Create a PointStamped message
             ps = PointStamped()
             ps.header.frame_id = source_frame
-            ps.header.stamp = rclpy.time.Time().to_msg()  # Latest available transform
+            ps.header.stamp = _LATEST.to_msg()  # Latest available transform
             ps.point.x = point[0]
             ps.point.y = point[1]
             ps.point.z = point[2] if len(point) > 2 else 0.0
 
-            # Transform point
-            transformed_ps = self.tf_buffer.transform(ps, target_frame, rclpy.duration.Duration(seconds=timeout))
+            # Transform point; the lookup waits up to timeout for the transform to become available
+            transformed_ps = self.tf_buffer.transform(ps, target_frame, _timeout_duration(timeout))
 
             # Return as Vector type
             if len(point) > 2:
@@ -134,12 +164,22 @@ class ROSTransformAbility:
         Returns:
             The transformed path as a Path, or None if the transform failed
         """
-        transformed_path = Path()
-        for point in path:
-            transformed_point = self.transform_point(point, source_frame, target_frame, timeout)
-            if transformed_point is not None:
-                transformed_path.append(transformed_point)
-        return transformed_path
+        points = path.points if isinstance(path, Path) else np.asarray(list(path), dtype=float)
+        if len(points) == 0:
+            return Path()
+
+        # Every point uses the same transform, so look it up once and apply it to all points
+        transform = self.transform(source_frame, target_frame, timeout)
+        if transform is None:
+            return Path()
+        rotation, translation = _rotation_translation(transform)
+
+        # 2D points are treated as z=0 and returned as 2D, like transform_point
+        dims = min(points.shape[1], 3)
+        xyz = np.zeros((len(points), 3))
+        xyz[:, :dims] = points[:, :dims]
+        transformed = xyz @ rotation.T + translation
+        return Path(transformed[:, :dims])
 
     def transform_rot(self, rotation: Vector, source_frame: str, target_frame: str = "map", timeout: float = 1.0):
         """Transform a rotation from source_frame to target_frame.
@@ -153,34 +193,38 @@ class ROSTransformAbility:
         Returns:
             The transformed rotation as a Vector of Euler angles (x, y, z), or None if the transform failed
         """
+        euler_angles = self.transform_rot_many([rotation], source_frame, target_frame, timeout)
+        if euler_angles is None:
+            return None
+        return Vector(euler_angles[0])
+
+    def transform_rot_many(self, rotations, source_frame: str, target_frame: str = "map", timeout: float = 1.0):
+        """Transform many rotations from source_frame to target_frame with a single transform lookup.
+
+        Args:
+            rotations: (N, 3) Euler angles (x, y, z) in radians
+            source_frame: The source frame of the rotations
+            target_frame: The target frame to transform to
+            timeout: Time to wait for the transform to become available (seconds)
+
+        Returns:
+            The transformed rotations as an (N, 3) array of Euler angles, or None if the transform failed
+        """
+        rotations = np.asarray(rotations, dtype=float).reshape(-1, 3)
         try:
-            # Wait for transform to become available
-            self.tf_buffer.can_transform(
-                target_frame, source_frame, rclpy.time.Time(), rclpy.duration.Duration(seconds=timeout)
-            )
-            
-            # Create a rotation matrix from the input Euler angles
-            input_rotation = R.from_euler('xyz', rotation, degrees=False)
-            
-            # Get the transform from source to target frame
+            # Get the transform from source to target frame (waits up to timeout)
             transform = self.transform(source_frame, target_frame, timeout)
             if transform is None:
                 return None
-                
-            # Extract the rotation from the transform
+            if len(rotations) == 0:
+                return np.empty((0, 3))
+
+            # Compose the transform rotation with all input rotations in one batched scipy call
             q = transform.transform.rotation
             transform_rotation = R.from_quat([q.x, q.y, q.z, q.w])
-            
-            # Compose the rotations
-            # The resulting rotation is the composition of the transform rotation and input rotation
-            result_rotation = transform_rotation * input_rotation
-            
-            # Convert back to Euler angles
-            euler_angles = result_rotation.as_euler('xyz', degrees=False)
-            
-            # Return as Vector type
-            return Vector(euler_angles)
-            
+            result_rotation = transform_rotation * R.from_euler("xyz", rotations, degrees=False)
+            return result_rotation.as_euler("xyz", degrees=False)
+
         except (tf2_ros.LookupException, tf2_ros.ConnectivityException, tf2_ros.ExtrapolationException) as e:
             logger.error(f"Transform rotation from {source_frame} to {target_frame} failed: {e}")
             return None
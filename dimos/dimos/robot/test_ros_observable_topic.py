@@ -3,19 +3,27 @@ import threading
 import time
 from nav_msgs import msg
 import pytest
-from dimos.robot.ros_observable_topic import ROSObservableTopicAbility
+from rclpy.qos import QoSProfile
+from dimos.robot.ros_observable_topic import ROSObservableTopicAbility, SENSOR_QOS
 from dimos.utils.logging_config import setup_logger
+from dimos.utils.threadpool import get_scheduler
 from dimos.types.costmap import Costmap
 from dimos.types.vector import Vector
 import asyncio
 
 
 class MockROSNode:
+    # All subscriptions are driven by a single thread that sleeps until the
+    # nearest publication deadline, instead of one thread per subscription
+    PERIOD = 0.1  # 10Hz publication rate
+
     def __init__(self):
         self.logger = setup_logger("ROS")
 
         self.sub_id_cnt = 0
         self.subs = {}
+        self._cond = threading.Condition()
+        self._driver_thread = None
 
     def _get_sub_id(self):
         sub_id = self.sub_id_cnt
@@ -26,30 +34,44 @@ class MockROSNode:
         # Mock implementation of ROS subscription
 
         sub_id = self._get_sub_id()
-        stop_event = threading.Event()
-        self.subs[sub_id] = stop_event
+        with self._cond:
+            # [next publication deadline, message count, topic, callback]
+            self.subs[sub_id] = [time.monotonic() + self.PERIOD, 0, topic_name, callback]
+            if self._driver_thread is None:
+                self._driver_thread = threading.Thread(target=self._drive, daemon=True)
+                self._driver_thread.start()
+            self._cond.notify()
         self.logger.info(f"Subscribed {topic_name} subid {sub_id}")
-
-        # Create message simulation thread
-        def simulate_messages():
-            message_count = 0
-            while not stop_event.is_set():
-                message_count += 1
-                time.sleep(0.1)  # 20Hz default publication rate
-                if topic_name == "/vector":
-                    callback([message_count, message_count])
-                else:
-                    callback(message_count)
-            # cleanup
-            self.subs.pop(sub_id)
-
-        thread = threading.Thread(target=simulate_messages, daemon=True)
-        thread.start()
         return sub_id
 
+    def _drive(self):
+        while True:
+            with self._cond:
+                while not self.subs:
+                    self._cond.wait()
+                sub_id, entry = min(self.subs.items(), key=lambda item: item[1][0])
+                delay = entry[0] - time.monotonic()
+                if delay > 0:
+                    # Woken early when subscriptions change; re-pick the nearest deadline
+                    self._cond.wait(delay)
+                    continue
+                entry[1] += 1
+                message_count, topic_name, callback = entry[1], entry[2], entry[3]
+
+            if topic_name == "/vector":
+                callback([message_count, message_count])
+            else:
+                callback(message_count)
+
+            with self._cond:
+                # Rearm once the callback returns, the cadence the tests were tuned against
+                entry[0] = time.monotonic() + self.PERIOD
+
     def destroy_subscription(self, subscription):
-        if subscription in self.subs:
-            self.subs[subscription].set()
+        with self._cond:
+            found = self.subs.pop(subscription, None) is not None
+            self._cond.notify()
+        if found:
             self.logger.info(f"Destroyed subscription: {subscription}")
         else:
             self.logger.info(f"Unknown subscription: {subscription}")
@@ -134,9 +156,9 @@ def test_parallel_and_cleanup():
 # here we test parallel subs and slow observers hogging our topic
 # we expect slow observers to skip messages by default
 #
-# ROS thread ─► ReplaySubject─► observe_on(pool) ─► backpressure.latest ─► sub1 (fast)
-#                          ├──► observe_on(pool) ─► backpressure.latest ─► sub2 (slow)
-#                          └──► observe_on(pool) ─► backpressure.latest ─► sub3 (slower)
+# ROS thread ─► ReplaySubject─► observe_latest ─► sub1 (fast)
+#                          ├──► observe_latest ─► sub2 (slow)
+#                          └──► observe_latest ─► sub3 (slower)
 def test_parallel_and_hog():
     robot = MockRobot()
 
@@ -175,6 +197,76 @@ def test_parallel_and_hog():
     assert robot._node.subs == {}
 
 
+# callers with their own scheduler or backpressure settings still share one ROS sub
+def test_single_ros_sub_across_settings():
+    robot = MockRobot()
+    received = []
+
+    subscription1 = robot.topic("/odom", msg.Odometry).subscribe(received.append)
+    subscription2 = robot.topic("/odom", msg.Odometry, scheduler=get_scheduler(), drop_unprocessed=False).subscribe(
+        received.append
+    )
+
+    time.sleep(0.25)
+    assert len(robot._node.subs) == 1, f"Expected 1 subscription, got {len(robot._node.subs)}: {robot._node.subs}"
+    assert sorted(received) == [1, 1, 2, 2]
+
+    subscription1.dispose()
+    subscription2.dispose()
+
+    time.sleep(0.1)
+    assert robot._node.subs == {}
+
+
+# per-topic worker threads are only created for subscribers without backpressure
+def test_topic_scheduler_only_without_backpressure():
+    robot = MockRobot()
+
+    robot.topic("/odom", msg.Odometry)
+    assert not getattr(robot, "_topic_schedulers", None)
+
+    robot.topic("/odom", msg.Odometry, drop_unprocessed=False)
+    robot.topic("/odom", msg.Odometry, drop_unprocessed=False)
+    assert list(robot._topic_schedulers) == ["/odom"]
+
+
+# equivalent QoSProfile instances passed by different callers share one ROS sub
+def test_qos_profile_dedup():
+    robot = MockRobot()
+
+    def profile():
+        return QoSProfile(
+            reliability=SENSOR_QOS.reliability,
+            history=SENSOR_QOS.history,
+            durability=SENSOR_QOS.durability,
+            depth=5,
+        )
+
+    subscription1 = robot.topic("/odom", msg.Odometry, qos=profile()).subscribe(lambda x: None)
+    subscription2 = robot.topic("/odom", msg.Odometry, qos=profile()).subscribe(lambda x: None)
+
+    assert len(robot._node.subs) == 1
+
+    subscription1.dispose()
+    subscription2.dispose()
+
+
+# synchronous subscribers are called directly on the ROS thread
+def test_synchronous_topic():
+    robot = MockRobot()
+    threads = []
+
+    subscription = robot.topic("/odom", msg.Odometry, synchronous=True).subscribe(
+        lambda x: threads.append(threading.current_thread())
+    )
+
+    time.sleep(0.25)
+    subscription.dispose()
+
+    assert len(threads) == 2
+    assert all(thread is robot._node._driver_thread for thread in threads)
+
+
 @pytest.mark.asyncio
 async def test_topic_latest_async():
     robot = MockRobot()
@@ -212,12 +304,14 @@ def test_topic_latest_sync_benchmark():
 
     odom = robot.topic_latest("/odom", msg.Odometry)
 
-    start_time = time.time()
-    for i in range(100):
+    # well under the 0.1s publication period, so the value below is still the first message
+    iterations = 10000
+    start_time = time.perf_counter()
+    for i in range(iterations):
         odom()
-    end_time = time.time()
+    end_time = time.perf_counter()
     elapsed = end_time - start_time
-    avg_time = elapsed / 100
+    avg_time = elapsed / iterations
 
     print("avg time", avg_time)
 
@@ -12,22 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import multiprocessing
-from typing import Optional, Union, Tuple
+from typing import Optional, Union, Tuple, Set
 import numpy as np
 from dimos.robot.robot import Robot
 from dimos.robot.unitree.unitree_skills import MyUnitreeSkills
 from dimos.skills.skills import AbstractRobotSkill, AbstractSkill, SkillLibrary
 from dimos.stream.video_providers.unitree import UnitreeVideoProvider
+from reactivex import operators as ops
 from reactivex.disposable import CompositeDisposable
 import logging
 import time
 from dimos.robot.unitree.external.go2_webrtc_connect.go2_webrtc_driver.webrtc_driver import WebRTCConnectionMethod
 import os
 from dimos.robot.unitree.unitree_ros_control import UnitreeROSControl
-from reactivex.scheduler import ThreadPoolScheduler
 import threading
 from dimos.utils.logging_config import setup_logger
+from dimos.utils.threadpool import get_available_cpus, PinnedThreadPoolScheduler
 from dimos.perception.person_tracker import PersonTrackingStream
 from dimos.perception.object_tracker import ObjectTrackingStream
 from dimos.robot.local_planner.vfh_local_planner import VFHPurePursuitPlanner
@@ -52,7 +52,7 @@ class UnitreeGo2(Robot):
         ip=None,
         connection_method: WebRTCConnectionMethod = WebRTCConnectionMethod.LocalSTA,
         serial_number: str = None,
-        output_dir: str = os.path.join(os.getcwd(), "assets", "output"),
+        output_dir: Optional[str] = None,
         use_ros: bool = True,
         use_webrtc: bool = False,
         disable_video_stream: bool = False,
@@ -61,6 +61,9 @@ class UnitreeGo2(Robot):
         spatial_memory_dir: str = None,
         spatial_memory_collection: str = "spatial_memory",
         new_memory: bool = False,
+        thread_pool_size: Optional[int] = None,
+        cpu_affinity: Optional[Set[int]] = None,
+        anchor_interval: int = 5,
     ):
         """Initialize the UnitreeGo2 robot.
 
@@ -69,7 +72,7 @@ class UnitreeGo2(Robot):
             ip: IP address of the robot (for LocalSTA connection)
             connection_method: WebRTC connection method (LocalSTA or LocalAP)
             serial_number: Serial number of the robot (for LocalSTA with serial)
-            output_dir: Directory for output files
+            output_dir: Directory for output files. If None, uses "assets/output" under the current working directory.
             use_ros: Whether to use ROSControl and ROS video provider
             use_webrtc: Whether to use WebRTC video provider ONLY
             disable_video_stream: Whether to disable the video stream
@@ -78,6 +81,9 @@ class UnitreeGo2(Robot):
             spatial_memory_dir: Directory for storing spatial memory data. If None, uses output_dir/spatial_memory.
             spatial_memory_collection: Name of the collection in the ChromaDB database.
             new_memory: If True, creates a new spatial memory from scratch.
+            thread_pool_size: Number of workers of the thread pool scheduler. If None, uses half the CPUs available to this process.
+            cpu_affinity: CPUs to pin the thread pool workers to. If None, workers may run on any CPU available to this process.
+            anchor_interval: Run the person detector on every Nth video frame only, moving the boxes with optical flow in between. 1 detects on every frame.
         """
         print(f"Initializing UnitreeGo2 with use_ros: {use_ros} and use_webrtc: {use_webrtc}")
         if not (use_ros ^ use_webrtc):  # XOR operator ensures exactly one is True
@@ -102,11 +108,16 @@ class UnitreeGo2(Robot):
             new_memory=new_memory,
         )
 
+        # Record spatial memory from startup when there is a ROS video stream to record
+        if self.ros_control is not None and self.ros_control.video_provider is not None:
+            self.prime_spatial_memory()
+
         if self.skill_library is not None:
             for skill in self.skill_library:
                 if isinstance(skill, AbstractRobotSkill):
                     self.skill_library.create_instance(skill.__name__, robot=self)
-            if isinstance(self.skill_library, MyUnitreeSkills):
+            # A library created above with robot=self has already been initialized
+            if isinstance(self.skill_library, MyUnitreeSkills) and self.skill_library._robot is not self:
                 self.skill_library._robot = self
                 self.skill_library.init()
                 self.skill_library.initialize_skills()
@@ -120,10 +131,13 @@ class UnitreeGo2(Robot):
         self.ip = ip
         self.disposables = CompositeDisposable()
         self.main_stream_obs = None
+        self.dropped_tracking_frames = 0
 
-        # Initialize thread pool scheduler
-        self.optimal_thread_count = multiprocessing.cpu_count()
-        self.thread_pool_scheduler = ThreadPoolScheduler(self.optimal_thread_count // 2)
+        # Initialize thread pool scheduler, sized from the CPUs its workers may actually use
+        self.optimal_thread_count = len(cpu_affinity) if cpu_affinity else get_available_cpus()
+        if thread_pool_size is None:
+            thread_pool_size = max(1, self.optimal_thread_count // 2)
+        self.thread_pool_scheduler = PinnedThreadPoolScheduler(thread_pool_size, cpu_affinity=cpu_affinity)
 
         if (connection_method == WebRTCConnectionMethod.LocalSTA) and (ip is None):
             raise ValueError("IP address is required for LocalSTA connection")
@@ -150,14 +164,20 @@ class UnitreeGo2(Robot):
                 camera_intrinsics=self.camera_intrinsics,
                 camera_pitch=self.camera_pitch,
                 camera_height=self.camera_height,
+                anchor_interval=anchor_interval,
             )
             self.object_tracker = ObjectTrackingStream(
                 camera_intrinsics=self.camera_intrinsics,
                 camera_pitch=self.camera_pitch,
                 camera_height=self.camera_height,
             )
-            person_tracking_stream = self.person_tracker.create_stream(self.video_stream_ros)
-            object_tracking_stream = self.object_tracker.create_stream(self.video_stream_ros)
+            # Each tracker gets the latest frame on its own worker; frames that arrive while
+            # a tracker is still busy are dropped, so tracking latency stays at one frame.
+            # backpressure() starts a worker per subscription, so each tracker's output is
+            # shared: one worker and one process_frame per tracker, whatever the consumers
+            tracking_video_stream = backpressure(self.video_stream_ros, on_drop=self._on_tracking_frame_dropped)
+            person_tracking_stream = self.person_tracker.create_stream(tracking_video_stream).pipe(ops.share())
+            object_tracking_stream = self.object_tracker.create_stream(tracking_video_stream).pipe(ops.share())
 
             self.person_tracking_stream = person_tracking_stream
             self.object_tracking_stream = object_tracking_stream
@@ -184,6 +204,12 @@ class UnitreeGo2(Robot):
         # Create the visualization stream at 5Hz
         self.local_planner_viz_stream = self.local_planner.create_stream(frequency_hz=5.0)
 
+    def _on_tracking_frame_dropped(self):
+        # Called from the video stream thread, for both trackers
+        self.dropped_tracking_frames += 1
+        if self.dropped_tracking_frames % 100 == 0:
+            logger.debug(f"Trackers skipped {self.dropped_tracking_frames} video frames so far")
+
     def get_skills(self) -> Optional[SkillLibrary]:
         return self.skill_library
 
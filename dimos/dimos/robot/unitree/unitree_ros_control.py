@@ -27,6 +27,8 @@ logger = setup_logger("dimos.robot.unitree.unitree_ros_control")
 
 class UnitreeROSControl(ROSControl):
     """Hardware interface for Unitree Go2 robot using ROS2"""
+
+    __slots__ = ()
     
     # ROS Camera Topics
     CAMERA_TOPICS = {
@@ -156,6 +156,40 @@ UNITREE_ROS_CONTROLS: List[Tuple[str, int, str]] = [
     )
 ]
 
+# ================================================
+# Procedurally created skills
+# ================================================
+class BaseUnitreeSkill(AbstractRobotSkill):
+    """Base skill for dynamic skill creation."""
+
+    def __call__(self):
+        string = f"{Colors.GREEN_PRINT_COLOR}This is a base skill, created for the specific skill: {self._app_id}{Colors.RESET_COLOR}"
+        print(string)
+        super().__call__()
+        if self._app_id is None:
+            raise RuntimeError(
+                f"{Colors.RED_PRINT_COLOR}"
+                f"No App ID provided to {self.__class__.__name__} Skill"
+                f"{Colors.RESET_COLOR}")
+        else:
+            self._robot.webrtc_req(api_id=self._app_id)
+            string = f"{Colors.GREEN_PRINT_COLOR}{self.__class__.__name__} was successful: id={self._app_id}{Colors.RESET_COLOR}"
+            print(string)
+            return string
+
+
+# One skill class per UNITREE_ROS_CONTROLS entry, created once at import
+_UNITREE_SKILL_CLASSES: Tuple[Type[BaseUnitreeSkill], ...] = tuple(
+    type(
+        name,  # Name of the class
+        (BaseUnitreeSkill,),  # Base classes
+        {
+            '__doc__': description,
+            '_app_id': app_id
+        })
+    for name, app_id, description in UNITREE_ROS_CONTROLS
+)
+
 # region MyUnitreeSkills
 
 class MyUnitreeSkills(SkillLibrary):
@@ -200,39 +234,8 @@ class MyUnitreeSkills(SkillLibrary):
         self.refresh_class_skills()
 
     def create_skills_live(self) -> List[AbstractRobotSkill]:
-        # ================================================
-        # Procedurally created skills
-        # ================================================
-        class BaseUnitreeSkill(AbstractRobotSkill):
-            """Base skill for dynamic skill creation."""
-
-            def __call__(self):
-                string = f"{Colors.GREEN_PRINT_COLOR}This is a base skill, created for the specific skill: {self._app_id}{Colors.RESET_COLOR}"
-                print(string)
-                super().__call__()
-                if self._app_id is None:
-                    raise RuntimeError(
-                        f"{Colors.RED_PRINT_COLOR}"
-                        f"No App ID provided to {self.__class__.__name__} Skill"
-                        f"{Colors.RESET_COLOR}")
-                else:
-                    self._robot.webrtc_req(api_id=self._app_id)
-                    string = f"{Colors.GREEN_PRINT_COLOR}{self.__class__.__name__} was successful: id={self._app_id}{Colors.RESET_COLOR}"
-                    print(string)
-                    return string
-
-        skills_classes = []
-        for name, app_id, description in UNITREE_ROS_CONTROLS:
-            skill_class = type(
-                name,  # Name of the class
-                (BaseUnitreeSkill,),  # Base classes
-                {
-                    '__doc__': description,
-                    '_app_id': app_id
-                })
-            skills_classes.append(skill_class)
-
-        return skills_classes
+        # The procedurally created skill classes are built once, at import
+        return list(_UNITREE_SKILL_CLASSES)
 
     # region Class-based Skills
     
@@ -287,3 +290,8 @@ class MyUnitreeSkills(SkillLibrary):
         def __call__(self):
             time.sleep(self.seconds)            
             return f"Wait completed with length={self.seconds}s"
+
+
+# Register the procedurally created skills up front, so every library instance
+# sees them from its first init()
+MyUnitreeSkills.register_skills(list(_UNITREE_SKILL_CLASSES))
@@ -73,7 +73,10 @@ class Costmap:
 
     @classmethod
     def from_msg(cls, costmap_msg: OccupancyGrid) -> "Costmap":
-        """Create a Costmap instance from a ROS OccupancyGrid message."""
+        """Create a Costmap instance from a ROS OccupancyGrid message.
+
+        The grid wraps the message data without copying and is read-only.
+        """
         if costmap_msg is None:
             raise Exception("need costmap msg")
 
@@ -95,9 +98,16 @@ class Costmap:
         qw = costmap_msg.info.origin.orientation.w
         origin_theta = math.atan2(2.0 * (qw * qz + qx * qy), 1.0 - 2.0 * (qy * qy + qz * qz))
 
-        # Convert to numpy array
-        data = np.array(costmap_msg.data, dtype=np.int8)
+        # Wrap the message buffer (array.array('b') in rclpy) without copying;
+        # fall back to a copy for data that does not expose the buffer protocol
+        try:
+            data = np.frombuffer(costmap_msg.data, dtype=np.int8)
+        except TypeError:
+            data = np.array(costmap_msg.data, dtype=np.int8)
         grid = data.reshape((height, width))
+        # The grid may alias the message, which is cached and shared between subscribers;
+        # keep it read-only so no costmap writes into it (set_value copies first)
+        grid.flags.writeable = False
 
         return cls(
             grid=grid,
@@ -176,6 +186,9 @@ class Costmap:
         point = self.world_to_grid(point)
 
         if 0 <= point.x < self.width and 0 <= point.y < self.height:
+            if not self.grid.flags.writeable:
+                # Copy on first write, e.g. a grid shared with a ROS message (see from_msg)
+                self.grid = self.grid.copy()
             self.grid[point.y, point.x] = value
             return value
         return False
@@ -1,23 +1,27 @@
 import threading
-from typing import Optional, TypeVar, Generic
+from typing import Callable, Optional, TypeVar, Generic
 
 import reactivex as rx
 from reactivex import operators as ops
 from reactivex.scheduler import ThreadPoolScheduler
 from reactivex.observable import Observable
-from rxpy_backpressure import BackPressure
+from reactivex.disposable import CompositeDisposable, Disposable
 
 from dimos.utils.threadpool import get_scheduler
+from dimos.utils.logging_config import setup_logger
+
+logger = setup_logger("dimos.utils.reactive")
 
 T = TypeVar('T')
 
-# Observable ─► ReplaySubject─► observe_on(pool) ─► backpressure.latest ─► sub1 (fast)
-#                           ├──► observe_on(pool) ─► backpressure.latest ─► sub2 (slow)
-#                           └──► observe_on(pool) ─► backpressure.latest ─► sub3 (slower)
+# Observable ─► ReplaySubject─► observe_latest ─► sub1 (fast)
+#                           ├──► observe_latest ─► sub2 (slow)
+#                           └──► observe_latest ─► sub3 (slower)
 def backpressure(
     observable: Observable[T],
     scheduler: Optional[ThreadPoolScheduler] = None,
     drop_unprocessed: bool = True,
+    on_drop: Optional[Callable[[], None]] = None,
 ) -> Observable[T]:
     if scheduler is None:
         scheduler = get_scheduler()
@@ -30,22 +34,97 @@ def backpressure(
 
     # per-subscriber factory
     def per_sub():
-        # Move processing to thread pool
-        base = core.pipe(ops.observe_on(scheduler))
-
-        # optional back-pressure handling
-        if not drop_unprocessed:
-            return base
-
-        def _subscribe(observer, sch=None):
-            return base.subscribe(BackPressure.LATEST(observer), scheduler=sch)
+        # Deliver on a worker thread, skipping items the subscriber is too slow for
+        if drop_unprocessed:
+            return core.pipe(observe_latest(on_drop))
 
-        return rx.create(_subscribe)
+        # Move processing to thread pool
+        return core.pipe(ops.observe_on(scheduler))
 
     # each `.subscribe()` call gets its own async backpressure chain
     return rx.defer(lambda *_: per_sub())
 
 
+def observe_latest(on_drop: Optional[Callable[[], None]] = None) -> Callable[[Observable[T]], Observable[T]]:
+    """Like ops.observe_on followed by BackPressure.LATEST, fused into one operator.
+
+    Each subscription gets one worker thread that delivers items from a single
+    slot. While the observer is busy, newer items overwrite the slot, so it
+    always receives the latest item next and intermediate ones are dropped.
+    Unlike BackPressure.LATEST this does not start a new thread per item.
+    Completion and errors are delivered after the pending item.
+
+    Args:
+        on_drop: Called (on the producer thread) whenever an undelivered item is overwritten
+    """
+
+    def _operator(source: Observable[T]) -> Observable[T]:
+        def subscribe(observer, sch=None):
+            lock = threading.Lock()
+            wakeup = threading.Event()
+            state = {"pending": False, "value": None, "terminal": None, "disposed": False}
+
+            def worker():
+                while True:
+                    wakeup.wait()
+                    with lock:
+                        if state["disposed"]:
+                            return
+                        terminal = None
+                        pending = state["pending"]
+                        if pending:
+                            value = state["value"]
+                            state["pending"] = False
+                            state["value"] = None
+                        else:
+                            # Nothing left to deliver; sleep until the next item
+                            wakeup.clear()
+                            terminal = state["terminal"]
+                            if terminal is None:
+                                continue
+                    if terminal is not None:
+                        terminal()
+                        return
+                    try:
+                        observer.on_next(value)
+                    except Exception as e:
+                        logger.error(f"Error in observer on_next: {e}")
+
+            def on_next(value):
+                with lock:
+                    dropped = state["pending"]
+                    state["value"] = value
+                    state["pending"] = True
+                    wakeup.set()
+                if dropped and on_drop is not None:
+                    on_drop()
+
+            def on_error(error):
+                with lock:
+                    state["terminal"] = lambda: observer.on_error(error)
+                    wakeup.set()
+
+            def on_completed():
+                with lock:
+                    state["terminal"] = observer.on_completed
+                    wakeup.set()
+
+            def dispose():
+                with lock:
+                    state["disposed"] = True
+                    state["value"] = None
+                    wakeup.set()
+
+            # Start the worker first; replayed items arrive synchronously on subscribe
+            threading.Thread(target=worker, name="observe_latest", daemon=True).start()
+            upstream = source.subscribe(on_next, on_error, on_completed, scheduler=sch)
+            return CompositeDisposable(upstream, Disposable(dispose))
+
+        return rx.create(subscribe)
+
+    return _operator
+
+
 class LatestReader(Generic[T]):
     """A callable object that returns the latest value from an observable."""
 
@@ -4,7 +4,7 @@ import numpy as np
 import reactivex as rx
 from reactivex import operators as ops
 from typing import Callable, TypeVar, Any
-from dimos.utils.reactive import backpressure, getter_streaming, getter_ondemand
+from dimos.utils.reactive import backpressure, getter_streaming, getter_ondemand, observe_latest
 from reactivex.disposable import Disposable
 
 
@@ -163,3 +163,21 @@ def test_getter_ondemand_timeout():
     with pytest.raises(Exception):
         getter()
     assert source.is_disposed(), "Observable should be disposed"
+
+def test_observe_latest_skips_to_latest():
+    received = []
+    completed = []
+    dropped = []
+    source = rx.from_iterable(range(20))
+
+    source.pipe(
+        observe_latest(on_drop=lambda: dropped.append(True)),
+        ops.do_action(lambda _: time.sleep(0.05)),
+    ).subscribe(received.append, on_completed=lambda: completed.append(True))
+
+    time.sleep(0.5)
+    assert completed, "Completion should be delivered after the pending item"
+    assert received[-1] == 19, f"Expected the latest item to be delivered, got {received}"
+    assert len(received) < 20, "Slow observer should skip intermediate items"
+    assert len(received) + len(dropped) == 20, "Every skipped item should be reported as dropped"
+    assert received == sorted(received), "Items should be delivered in order"
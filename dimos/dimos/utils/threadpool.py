@@ -20,19 +20,37 @@ ReactiveX scheduler, ensuring consistent thread management across the applicatio
 
 import os
 import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Optional
 from reactivex.scheduler import ThreadPoolScheduler
 from .logging_config import logger
 
 
+def get_available_cpus() -> int:
+    """Return the number of CPUs this process may run on.
+
+    Uses the scheduler affinity mask where the platform provides it, so that
+    containers, cgroups or taskset restrictions are respected, and falls back
+    to the host CPU count elsewhere (e.g. macOS, Windows).
+
+    Returns:
+        int: The number of usable CPUs.
+    """
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return multiprocessing.cpu_count()
+
+
 def get_max_workers() -> int:
     """Determine the number of workers for the thread pool.
 
     Returns:
         int: The number of workers, configurable via the DIMOS_MAX_WORKERS
-        environment variable, defaulting to 4 times the CPU count.
+        environment variable, defaulting to 4 times the available CPU count.
     """
     env_value = os.getenv('DIMOS_MAX_WORKERS', '')
-    return int(env_value) if env_value.strip() else multiprocessing.cpu_count() * 4
+    return int(env_value) if env_value.strip() else get_available_cpus() * 4
 
 
 # Create a ThreadPoolScheduler with a configurable number of workers.
@@ -69,6 +87,33 @@ def make_single_thread_scheduler() -> ThreadPoolScheduler:
     return ThreadPoolScheduler(max_workers=1)
 
 
+def _pin_current_thread(cpus: frozenset) -> None:
+    # pid 0 applies to the calling thread on Linux, i.e. the new pool worker
+    try:
+        os.sched_setaffinity(0, cpus)
+    except OSError as e:
+        logger.warning(f"Could not pin worker thread to CPUs {sorted(cpus)}: {e}")
+
+
+class PinnedThreadPoolScheduler(ThreadPoolScheduler):
+    """ThreadPoolScheduler whose worker threads are pinned to a set of CPUs.
+
+    Each worker sets its own CPU affinity when it starts, so the OS cannot
+    migrate it off the given cores. On platforms without os.sched_setaffinity
+    (e.g. macOS, Windows) it behaves like a plain ThreadPoolScheduler.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, cpu_affinity: Optional[Iterable[int]] = None) -> None:
+        super().__init__(max_workers)
+        if cpu_affinity is None or not hasattr(os, "sched_setaffinity"):
+            return
+        # No worker has been started yet, so the executor can still be swapped
+        self.executor.shutdown(wait=False)
+        self.executor = ThreadPoolExecutor(
+            max_workers=max_workers, initializer=_pin_current_thread, initargs=(frozenset(cpu_affinity),)
+        )
+
+
 # Example usage:
 # scheduler = get_scheduler()
 # # Use the scheduler for parallel tasks